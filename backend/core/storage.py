@@ -53,6 +53,23 @@ def upload_stream(data: bytes, object_name: str, content_type: str = "applicatio
         print(f"Error uploading stream: {e}")
         raise
 
+def upload_buffer(buffer: io.BytesIO, object_name: str, content_type: str = "application/octet-stream"):
+    """Upload everything written to a BytesIO buffer to MinIO."""
+    try:
+        length = buffer.tell()
+        buffer.seek(0)
+        client.put_object(
+            MINIO_BUCKET,
+            object_name,
+            buffer,
+            length,
+            content_type=content_type
+        )
+        return object_name
+    except S3Error as e:
+        print(f"Error uploading buffer: {e}")
+        raise
+
 def get_file_url(object_name):
     """Get a download URL for the file (via backend proxy)."""
     # 백엔드 프록시를 통한 다운로드 URL 반환
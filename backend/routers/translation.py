@@ -5,7 +5,7 @@ from sqlalchemy.orm import Session
 from typing import Optional
 from core.database import get_db, Job
 from core.storage import get_file_content, upload_stream
-from services.translation_service import process_translation_job, translate_chunk, split_text
+from services.translation_service import process_translation_job, translate_chunks_async, split_text
 from services.translation_template_service import get_template, save_template
 from services.translation_file_service import extract_text_from_file
 import uuid
@@ -78,7 +78,7 @@ async def start_translation_job(request: TranslationRequest, background_tasks: B
 
 @router.get("/translate/template")
 async def get_current_template():
-    return get_template()
+    return dict(get_template())
 
 class TemplateRequest(BaseModel):
     system_prompt: str
@@ -107,22 +107,19 @@ async def simple_translation(request: SimpleTranslationRequest, db: Session = De
     # Split text if it's too long, though for "simple" we might just process it.
     # But to be safe and consistent, let's split and join.
     chunks = split_text(request.text)
-    translated_parts = []
     
-    for chunk in chunks:
-        # We can't use background tasks here easily if we want to return the result synchronously.
-        # So we'll do it synchronously. This might timeout for very large texts.
-        translated = translate_chunk(
-            chunk, 
-            request.provider,
-            request.api_url, 
-            request.api_key, 
-            request.model, 
-            request.target_lang,
-            request.src_lang,
-            request.system_prompt
-        )
-        translated_parts.append(translated)
+    # We can't use background tasks here easily if we want to return the result synchronously.
+    # So we wait for it here, sending chunk batches concurrently. This might timeout for very large texts.
+    translated_parts = await translate_chunks_async(
+        chunks, 
+        request.provider,
+        request.api_url, 
+        request.api_key, 
+        request.model, 
+        request.target_lang,
+        request.src_lang,
+        request.system_prompt
+    )
     
     final_translation = "\n\n".join(translated_parts)
 
@@ -197,20 +194,16 @@ async def translate_file(
         
         # Split and translate
         chunks = split_text(text)
-        translated_parts = []
-        
-        for chunk in chunks:
-            translated = translate_chunk(
-                chunk, 
-                provider,
-                api_url, 
-                api_key, 
-                model, 
-                target_lang,
-                src_lang,
-                system_prompt
-            )
-            translated_parts.append(translated)
+        translated_parts = await translate_chunks_async(
+            chunks, 
+            provider,
+            api_url, 
+            api_key, 
+            model, 
+            target_lang,
+            src_lang,
+            system_prompt
+        )
         
         final_translation = "\n\n".join(translated_parts)
         
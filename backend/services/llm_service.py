@@ -1,8 +1,62 @@
+import atexit
+import functools
+import itertools
+import json
+import threading
+from collections import Counter
+
 import requests
+from requests.adapters import HTTPAdapter
 from core.logger import setup_logger
 
+try:
+    # Faster request/response (de)serialization when available; stdlib json otherwise
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = setup_logger("llm_service")
 
+def _dumps(data) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False).encode('utf-8')
+
+def _loads(raw: bytes):
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+# Shared keep-alive session so each chunk reuses pooled TCP/TLS connections
+# instead of opening a new one per request (sized for concurrent translation batches).
+_session = requests.Session()
+_adapter = HTTPAdapter(pool_connections=8, pool_maxsize=32)
+_session.mount("http://", _adapter)
+_session.mount("https://", _adapter)
+atexit.register(_session.close)
+
+# In-flight request count per endpoint, used to pick the least busy one
+_inflight = Counter()
+_inflight_lock = threading.Lock()
+_rotation = itertools.count()
+
+@functools.lru_cache(maxsize=32)
+def _split_endpoints(api_url: str) -> tuple:
+    return tuple(url.strip() for url in api_url.split(',') if url.strip()) or (api_url,)
+
+def _ordered_endpoints(endpoints: tuple) -> list:
+    # Least busy first; ties are rotated so idle endpoints share the load
+    with _inflight_lock:
+        start = next(_rotation) % len(endpoints)
+        rotated = endpoints[start:] + endpoints[:start]
+        return sorted(rotated, key=lambda url: _inflight[url])
+
+def _is_retryable(error: Exception) -> bool:
+    if isinstance(error, (requests.ConnectionError, requests.Timeout)):
+        return True
+    response = getattr(error, "response", None)
+    return isinstance(error, requests.HTTPError) and response is not None and response.status_code >= 500
+
 def send_llm_request(provider: str, api_url: str, api_key: str, model: str, system_prompt: str, user_prompt: str, temperature: float = 0.7) -> str:
     """
     Sends a request to an LLM API (OpenWebUI or Ollama).
@@ -10,6 +64,8 @@ def send_llm_request(provider: str, api_url: str, api_key: str, model: str, syst
     Args:
         provider (str): The provider type ('openwebui' or 'ollama').
         api_url (str): The base URL of the API (e.g., http://localhost:3000 or http://localhost:11434).
+            Several comma-separated URLs form a pool: each request goes to the least busy
+            endpoint and fails over to the next one on connection errors, timeouts or 5xx.
         api_key (str): The API key for authentication (may be empty for Ollama).
         model (str): The model name to use.
         system_prompt (str): The system instruction.
@@ -20,9 +76,23 @@ def send_llm_request(provider: str, api_url: str, api_key: str, model: str, syst
         str: The generated text content.
     """
     if provider == "ollama":
-        return _send_ollama_request(api_url, api_key, model, system_prompt, user_prompt, temperature)
+        send = _send_ollama_request
     else:  # openwebui or default
-        return _send_openwebui_request(api_url, api_key, model, system_prompt, user_prompt, temperature)
+        send = _send_openwebui_request
+
+    endpoints = _ordered_endpoints(_split_endpoints(api_url))
+    for attempt, endpoint in enumerate(endpoints, start=1):
+        with _inflight_lock:
+            _inflight[endpoint] += 1
+        try:
+            return send(endpoint, api_key, model, system_prompt, user_prompt, temperature)
+        except Exception as e:
+            if attempt == len(endpoints) or not _is_retryable(e):
+                raise
+            logger.warning(f"LLM endpoint {endpoint} failed ({e}); trying the next endpoint")
+        finally:
+            with _inflight_lock:
+                _inflight[endpoint] -= 1
 
 def _send_openwebui_request(api_url: str, api_key: str, model: str, system_prompt: str, user_prompt: str, temperature: float) -> str:
     """
@@ -47,9 +117,9 @@ def _send_openwebui_request(api_url: str, api_key: str, model: str, system_promp
 
     try:
         logger.info(f"Sending OpenWebUI request to {target_url} (Model: {model})")
-        response = requests.post(target_url, headers=headers, json=data, timeout=120)
+        response = _session.post(target_url, headers=headers, data=_dumps(data), timeout=120)
         response.raise_for_status()
-        result = response.json()
+        result = _loads(response.content)
         
         if 'choices' in result and len(result['choices']) > 0:
             return result['choices'][0]['message']['content'].strip()
@@ -87,11 +157,14 @@ def _send_ollama_request(api_url: str, api_key: str, model: str, system_prompt:
         "stream": False
     }
 
+    # Set before the request so connection errors and timeouts reach the
+    # caller unchanged (send_llm_request fails over on them)
+    response = None
     try:
         logger.info(f"Sending Ollama generate request to {target_url} (Model: {model})")
-        response = requests.post(target_url, headers=headers, json=data, timeout=120)
+        response = _session.post(target_url, headers=headers, data=_dumps(data), timeout=120)
         response.raise_for_status()
-        result = response.json()
+        result = _loads(response.content)
         
         if 'response' in result:
             return result['response'].strip()
@@ -1,29 +1,57 @@
+import functools
+import io
 import os
 import json
 import yt_dlp
 import whisper
 import re
+import threading
 from sqlalchemy.orm import Session
 from core.database import Job, SessionLocal, LLMConfig
-from core.storage import upload_file, upload_stream
+from core.storage import upload_file, upload_stream, upload_buffer
 from core.logger import setup_logger
 from services.summary_service import generate_summary
-from services.translation_service import translate_chunk, split_text
+from services.translation_service import translate_chunk, split_text, write_sections
 
 logger = setup_logger("stt_service")
 
+# Anything other than letters, digits, '_', ' ' and '-' is dropped from filenames
+UNSAFE_FILENAME_PATTERN = re.compile(r'[^\w \-]')
+
 def get_video_title(youtube_url):
     ydl_opts = {'quiet': True, 'no_warnings': True}
     try:
         with yt_dlp.YoutubeDL(ydl_opts) as ydl:
             info = ydl.extract_info(youtube_url, download=False)
             title = info.get('title', 'youtube_video')
-            safe_title = "".join(c for c in title if c.isalnum() or c in (' ', '-', '_')).strip()
+            safe_title = UNSAFE_FILENAME_PATTERN.sub('', title).strip()
             return safe_title.replace(' ', '_')
     except Exception as e:
         logger.error(f"Error getting title: {e}")
         return "youtube_video"
 
+# Cached models stay in memory for the life of the API process (a large
+# model is several GB), so only keep as many sizes as configured.
+WHISPER_MODEL_CACHE_SIZE = int(os.getenv("WHISPER_MODEL_CACHE_SIZE", "1"))
+
+@functools.lru_cache(maxsize=WHISPER_MODEL_CACHE_SIZE)
+def get_whisper_model(model_size):
+    # Whisper weights are hundreds of MB; load each size once per process
+    return whisper.load_model(model_size)
+
+@functools.lru_cache(maxsize=None)
+def _transcribe_lock(model_size):
+    return threading.Lock()
+
+def transcribe(model_size, audio_path):
+    # Jobs run concurrently in the background threadpool and share the cached
+    # model; whisper installs KV-cache hooks on the model per decode, so two
+    # decodes on one model would corrupt each other. Serialize per model size.
+    with _transcribe_lock(model_size):
+        model = get_whisper_model(model_size)
+        # FP16 is only supported on CUDA; on CPU whisper would warn and fall back
+        return model.transcribe(audio_path, fp16=model.device.type == "cuda")
+
 def download_audio(youtube_url, output_path):
     logger.info(f"Downloading audio from {youtube_url} to {output_path}")
     ydl_opts = {
@@ -38,24 +66,28 @@ def download_audio(youtube_url, output_path):
     logger.info("Download complete")
     return output_path + ".mp3"
 
+# Simple timestamp matcher: 00:00:00.000 --> 00:00:00.000
+VTT_TIMESTAMP_PATTERN = re.compile(r'\d{2}:\d{2}:\d{2}\.\d{3} --> \d{2}:\d{2}:\d{2}\.\d{3}')
+VTT_TAG_PATTERN = re.compile(r'<[^>]+>')
+
 def clean_vtt_content(content):
-    lines = content.splitlines()
+    # Accepts the VTT text or any iterable of lines (e.g. an open file),
+    # so subtitle files can be cleaned without reading them fully first.
+    lines = content.splitlines() if isinstance(content, str) else content
     text = []
     seen = set()
-    # Simple timestamp matcher: 00:00:00.000 --> 00:00:00.000
-    timestamp_pattern = re.compile(r'\d{2}:\d{2}:\d{2}\.\d{3} --> \d{2}:\d{2}:\d{2}\.\d{3}')
     
     for line in lines:
         line = line.strip()
         if not line or line == "WEBVTT":
             continue
-        if timestamp_pattern.search(line):
+        if VTT_TIMESTAMP_PATTERN.search(line):
             continue
         if line.isdigit() and "-->" not in line: 
              continue
              
         # Remove HTML-like tags
-        clean_line = re.sub(r'<[^>]+>', '', line)
+        clean_line = VTT_TAG_PATTERN.sub('', line)
         if clean_line and clean_line not in seen:
             text.append(clean_line)
             seen.add(clean_line)
@@ -102,9 +134,9 @@ def download_manual_subtitle(youtube_url, base_path):
         expected_file = f"{base_path}.{target_lang}.vtt"
         if os.path.exists(expected_file):
             with open(expected_file, 'r', encoding='utf-8') as f:
-                content = f.read()
+                content = clean_vtt_content(f)
             os.remove(expected_file)
-            return clean_vtt_content(content)
+            return content
     except Exception as e:
         logger.error(f"Error downloading subtitle: {e}")
         return None
@@ -162,12 +194,12 @@ def process_stt_job(job_id: int, youtube_url: str, model_size: str):
         else:
             # 3. Transcribe with Whisper (Fallback)
             logger.info(f"Job {job_id}: No suitable subtitles found. Loading Whisper model ({model_size})...")
-            model = whisper.load_model(model_size)
+            get_whisper_model(model_size)
             job.progress = 60
             db.commit()
             
             logger.info(f"Job {job_id}: Transcribing audio...")
-            result = model.transcribe(final_audio_path)
+            result = transcribe(model_size, final_audio_path)
             text = result["text"].strip()
             
         logger.info(f"Job {job_id}: Transcription/Subtitle extraction complete. Length: {len(text)} chars")
@@ -218,12 +250,10 @@ def process_stt_job(job_id: int, youtube_url: str, model_size: str):
                     )
                     translated_parts.append(translated)
                 
-                final_translation = "\n\n".join(translated_parts)
-                
                 # Upload translation to MinIO
                 translation_object_name = f"{base_filename}_translation.txt"
                 logger.info(f"Job {job_id}: Uploading translation to MinIO as {translation_object_name}...")
-                upload_stream(final_translation.encode('utf-8'), translation_object_name, "text/plain")
+                upload_buffer(write_sections(io.BytesIO(), translated_parts), translation_object_name, "text/plain")
                 logger.info(f"Job {job_id}: Translation completed successfully")
             else:
                 logger.warning(f"Job {job_id}: No LLM configuration found. Skipping translation.")
@@ -278,7 +308,7 @@ def process_uploaded_file_job(job_id: int, audio_file_path: str, model_size: str
         # Get original filename without extension for naming
         original_filename = job.original_filename or "uploaded_audio"
         base_filename = os.path.splitext(original_filename)[0]
-        safe_filename = "".join(c for c in base_filename if c.isalnum() or c in (' ', '-', '_')).strip()
+        safe_filename = UNSAFE_FILENAME_PATTERN.sub('', base_filename).strip()
         safe_filename = safe_filename.replace(' ', '_')
         base_filename = f"{job_id}_{safe_filename}"
         
@@ -301,12 +331,12 @@ def process_uploaded_file_job(job_id: int, audio_file_path: str, model_size: str
 
         # Transcribe with Whisper
         logger.info(f"Job {job_id}: Loading Whisper model ({model_size})...")
-        model = whisper.load_model(model_size)
+        get_whisper_model(model_size)
         job.progress = 50
         db.commit()
         
         logger.info(f"Job {job_id}: Transcribing audio...")
-        result = model.transcribe(audio_file_path)
+        result = transcribe(model_size, audio_file_path)
         text = result["text"].strip()
         
         logger.info(f"Job {job_id}: Transcription complete. Length: {len(text)} chars")
@@ -354,11 +384,9 @@ def process_uploaded_file_job(job_id: int, audio_file_path: str, model_size: str
                     )
                     translated_parts.append(translated)
                 
-                final_translation = "\n\n".join(translated_parts)
-                
                 translation_object_name = f"{base_filename}_translation.txt"
                 logger.info(f"Job {job_id}: Uploading translation to MinIO as {translation_object_name}...")
-                upload_stream(final_translation.encode('utf-8'), translation_object_name, "text/plain")
+                upload_buffer(write_sections(io.BytesIO(), translated_parts), translation_object_name, "text/plain")
                 logger.info(f"Job {job_id}: Translation completed successfully")
             else:
                 logger.warning(f"Job {job_id}: No LLM configuration found. Skipping translation.")
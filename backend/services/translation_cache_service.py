@@ -0,0 +1,83 @@
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from core.logger import setup_logger
+
+logger = setup_logger("translation_cache_service")
+
+CACHE_FILE = os.getenv("TRANSLATION_CACHE_FILE", "translation_cache.db")
+CACHE_TTL_SECONDS = 30 * 24 * 60 * 60
+# How often a write also sweeps all expired rows out of the file
+CACHE_PURGE_INTERVAL_SECONDS = 60 * 60
+# Near-duplicate matching: ignore case, punctuation and spacing differences
+FUZZY_CACHE_ENABLED = os.getenv("TRANSLATION_FUZZY_CACHE", "False").lower() == "true"
+FUZZY_SEPARATOR_PATTERN = re.compile(r'[\W_]+')
+
+_lock = threading.Lock()
+_connection = None
+_last_purge = 0.0
+
+def _get_connection():
+    global _connection
+    if _connection is None:
+        _connection = sqlite3.connect(CACHE_FILE, check_same_thread=False)
+        _connection.execute(
+            "CREATE TABLE IF NOT EXISTS translations ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, created_at REAL NOT NULL)"
+        )
+    return _connection
+
+def make_key(text, model, src_lang, target_lang, prompt_version, fuzzy=False):
+    if fuzzy:
+        normalized = FUZZY_SEPARATOR_PATTERN.sub(' ', unicodedata.normalize("NFKC", text).casefold()).strip()
+        if not normalized:
+            return None
+    else:
+        # NFC + strip so chunks that only differ in normalization/whitespace share an entry
+        normalized = unicodedata.normalize("NFC", text).strip()
+    kind = "fuzzy" if fuzzy else "exact"
+    raw = "\x1f".join((kind, model, src_lang, target_lang, prompt_version, normalized))
+    return hashlib.blake2b(raw.encode('utf-8'), digest_size=16).hexdigest()
+
+def get_cached(key):
+    try:
+        with _lock:
+            connection = _get_connection()
+            row = connection.execute(
+                "SELECT value, created_at FROM translations WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None and time.time() - row[1] > CACHE_TTL_SECONDS:
+                # Drop the stale row so the file does not keep growing
+                connection.execute("DELETE FROM translations WHERE key = ?", (key,))
+                connection.commit()
+                return None
+    except sqlite3.Error as e:
+        logger.error(f"Translation cache lookup failed: {e}")
+        return None
+    if row is None:
+        return None
+    return row[0]
+
+def set_cached(key, value):
+    global _last_purge
+    try:
+        with _lock:
+            connection = _get_connection()
+            now = time.time()
+            connection.execute(
+                "INSERT OR REPLACE INTO translations (key, value, created_at) VALUES (?, ?, ?)",
+                (key, value, now)
+            )
+            if now - _last_purge > CACHE_PURGE_INTERVAL_SECONDS:
+                # Expired rows that are never looked up again are removed here
+                connection.execute(
+                    "DELETE FROM translations WHERE created_at < ?", (now - CACHE_TTL_SECONDS,)
+                )
+                _last_purge = now
+            connection.commit()
+    except sqlite3.Error as e:
+        logger.error(f"Translation cache update failed: {e}")
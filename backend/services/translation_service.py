@@ -1,10 +1,16 @@
+import asyncio
+import functools
+import io
 import json
+import os
+import re
 import time
 from sqlalchemy.orm import Session
 from core.database import Job, SessionLocal
-from core.storage import upload_stream
+from core.storage import upload_buffer
 from core.logger import setup_logger
 from services.llm_service import send_llm_request
+from services.translation_cache_service import make_key, get_cached, set_cached, FUZZY_CACHE_ENABLED
 from services.translation_template_service import get_template, DEFAULT_TEMPLATE
 from services.summary_template_service import get_template as get_summary_template, DEFAULT_TEMPLATE as DEFAULT_SUMMARY_TEMPLATE
 
@@ -18,26 +24,81 @@ LANG_NAMES_KO = {
     'auto': '자동감지'
 }
 
+# A batch closes at whichever limit is hit first: item count or total characters.
+# Batching is meant for short strings: the character budget keeps the input,
+# the JSON-wrapped translation (Korean output takes several times as many
+# tokens per character) and the system prompt inside a 2k-token context such
+# as Ollama's default num_ctx. Full-size split_text chunks (~2000 chars)
+# exceed it on their own and go through the single-chunk path.
+TRANSLATION_BATCH_SIZE = 16
+TRANSLATION_BATCH_CHARS = int(os.getenv("TRANSLATION_BATCH_CHARS", "1000"))
+TRANSLATION_CONCURRENCY = int(os.getenv("TRANSLATION_CONCURRENCY", "4"))
+BATCH_INSTRUCTION = " The input is a JSON array of texts. Translate every item separately and respond with only a JSON array of the translations, in the same order and with the same number of items."
+BATCH_FENCE_PATTERN = re.compile(r'^```(?:json)?\s*|\s*```$')
+
+PROMPT_PLACEHOLDER_PATTERN = re.compile(r'\{(source_lang|src_lang_code|target_lang|tgt_lang_code|text)\}')
+# Hangul syllables and jamo, used to recognise Korean input when the source is 'auto'
+HANGUL_PATTERN = re.compile(r'[\uac00-\ud7a3\u1100-\u11ff\u3130-\u318f]')
+# Share of letters that must be Hangul before a chunk is treated as Korean;
+# leaves room for a few acronyms (API, URL) but not for mixed-language text
+KOREAN_LETTER_RATIO = 0.95
+
+@functools.lru_cache(maxsize=32)
+def compile_prompt(template):
+    # Split the template once into (literal, placeholder) pairs; rendering a
+    # chunk then only joins strings instead of rescanning for each placeholder.
+    parts = []
+    pos = 0
+    for match in PROMPT_PLACEHOLDER_PATTERN.finditer(template):
+        parts.append((template[pos:match.start()], match.group(1)))
+        pos = match.end()
+    parts.append((template[pos:], None))
+    return tuple(parts)
+
+def render_prompt(template, values):
+    # Placeholders without a value are kept as-is, like the old str.replace chain
+    return "".join(
+        literal + values.get(name, "{" + name + "}") if name else literal
+        for literal, name in compile_prompt(template)
+    )
+
+def write_sections(buffer, sections, separator="\n\n"):
+    # Encode each section straight into the buffer instead of building the
+    # joined string (and its encoded copy) first.
+    sep = separator.encode('utf-8')
+    for i, section in enumerate(sections):
+        if i:
+            buffer.write(sep)
+        buffer.write(section.encode('utf-8'))
+    return buffer
+
 def split_text(text, chunk_size=2000):
+    # Collect paragraphs in a list with a running length (the length of the
+    # chunk including its newlines) and join once per chunk, instead of
+    # growing a string with += for every paragraph.
     chunks = []
-    current_chunk = ""
+    current = []
+    current_len = 0
     paragraphs = text.split('\n')
     for paragraph in paragraphs:
-        if len(current_chunk) + len(paragraph) < chunk_size:
-            current_chunk += paragraph + "\n"
+        if current_len + len(paragraph) < chunk_size:
+            current.append(paragraph)
+            current_len += len(paragraph) + 1
         else:
-            if current_chunk:
-                chunks.append(current_chunk)
+            if current:
+                chunks.append('\n'.join(current) + '\n')
             if len(paragraph) > chunk_size:
                 chunks.append(paragraph + "\n")
-                current_chunk = ""
+                current = []
+                current_len = 0
             else:
-                current_chunk = paragraph + "\n"
-    if current_chunk:
-        chunks.append(current_chunk)
+                current = [paragraph]
+                current_len = len(paragraph) + 1
+    if current:
+        chunks.append('\n'.join(current) + '\n')
     return chunks
 
-def translate_chunk(text, provider, api_url, api_key, model, target_lang='ko', src_lang='en', system_prompt_override=None):
+def build_prompts(text, target_lang='ko', src_lang='en', system_prompt_override=None):
     template = get_template()
     
     # Map language codes to names/display codes
@@ -62,6 +123,7 @@ def translate_chunk(text, provider, api_url, api_key, model, target_lang='ko', s
         system_prompt = template.get("system_prompt", DEFAULT_TEMPLATE["system_prompt"])
 
     # Handle 'auto' cases specifically for clearer instructions
+    suffix = ""
     if src_lang == 'auto' and target_lang == 'auto':
         # Truly automatic bidirectional translation (defaulting to Ko <-> En)
         system_prompt = "You are a professional bidirectional translator. Your task is to auto-detect the source language and translate it into the most appropriate target language. If the input is in English, translate it to Korean. If the input is in Korean, translate it to English. For other languages, default to English. Produce only the translation result without any commentary."
@@ -69,50 +131,212 @@ def translate_chunk(text, provider, api_url, api_key, model, target_lang='ko', s
         # Known target, auto source
         source_name = "the detected source language"
         source_code = "auto-detected"
-        
-        system_prompt = system_prompt.replace("{target_lang}", target_name)
-        system_prompt = system_prompt.replace("{tgt_lang_code}", target_code)
-        system_prompt = system_prompt.replace("{source_lang}", source_name)
-        system_prompt = system_prompt.replace("{src_lang_code}", source_code)
-        system_prompt += f" The source language should be automatically detected from the input text before translating to {target_name}."
+        suffix = f" The source language should be automatically detected from the input text before translating to {target_name}."
     elif target_lang == 'auto':
         # Known source, auto target (En -> Ko or Ko -> En or other -> En)
         if src_lang == 'en':
             target_name, target_code = ('Korean', 'ko')
         else:
             target_name, target_code = ('English', 'en')
-            
-        system_prompt = system_prompt.replace("{target_lang}", target_name)
-        system_prompt = system_prompt.replace("{tgt_lang_code}", target_code)
-        system_prompt = system_prompt.replace("{source_lang}", source_name)
-        system_prompt = system_prompt.replace("{src_lang_code}", source_code)
-        system_prompt += f" Since target language is auto-detected, translate this {source_name} text into {target_name}."
-    else:
-        # Static source and target
-        system_prompt = system_prompt.replace("{target_lang}", target_name)
-        system_prompt = system_prompt.replace("{tgt_lang_code}", target_code)
-        system_prompt = system_prompt.replace("{source_lang}", source_name)
-        system_prompt = system_prompt.replace("{src_lang_code}", source_code)
+        suffix = f" Since target language is auto-detected, translate this {source_name} text into {target_name}."
+
+    # Fill placeholders using the final determined names/codes.
+    # The system prompt must not contain per-chunk values (the text only goes
+    # into the user prompt): it stays byte-identical across a job, so servers
+    # with automatic prefix caching (OpenAI-compatible, Ollama) can reuse it.
+    values = {
+        "target_lang": target_name,
+        "tgt_lang_code": target_code,
+        "source_lang": source_name,
+        "src_lang_code": source_code,
+    }
+    system_prompt = render_prompt(system_prompt, values) + suffix
 
     user_prompt_template = template.get("user_prompt_template", DEFAULT_TEMPLATE["user_prompt_template"])
-    
-    # Handle placeholders in user prompt (using final determined names/codes)
-    user_prompt_template = user_prompt_template.replace("{target_lang}", target_name)
-    user_prompt_template = user_prompt_template.replace("{tgt_lang_code}", target_code)
-    user_prompt_template = user_prompt_template.replace("{source_lang}", source_name)
-    user_prompt_template = user_prompt_template.replace("{src_lang_code}", source_code)
-    
-    user_prompt = user_prompt_template.replace("{text}", text)
+    values["text"] = text
+    user_prompt = render_prompt(user_prompt_template, values)
     
     logger.info(f"Translation Task: {source_name} ({source_code}) -> {target_name} ({target_code})")
     logger.info(f"System Prompt: {system_prompt}")
     logger.info(f"User Prompt (first 1000 chars): {user_prompt[:1000]}...")
+    return system_prompt, user_prompt
+
+def translation_cache_keys(text, provider, model, target_lang='ko', src_lang='en', system_prompt_override=None, fuzzy=FUZZY_CACHE_ENABLED):
+    # The prompts are part of the key so editing the template invalidates old entries
+    template = get_template()
+    prompt_version = "\x1f".join((
+        system_prompt_override or "",
+        template.get("system_prompt", DEFAULT_TEMPLATE["system_prompt"]),
+        template.get("user_prompt_template", DEFAULT_TEMPLATE["user_prompt_template"]),
+    ))
+    model_key = f"{provider}:{model}"
+    keys = [make_key(text, model_key, src_lang, target_lang, prompt_version)]
+    if fuzzy:
+        fuzzy_key = make_key(text, model_key, src_lang, target_lang, prompt_version, fuzzy=True)
+        if fuzzy_key:
+            keys.append(fuzzy_key)
+    return keys
+
+def lookup_translation(cache_keys):
+    # Exact match first, then the near-duplicate key when fuzzy caching is on
+    for key in cache_keys:
+        cached = get_cached(key)
+        if cached is not None:
+            return cached
+    return None
+
+def cache_translation(cache_keys, translated):
+    # Only cache real translations, not error placeholders
+    if isinstance(translated, str) and not translated.startswith("[Error]"):
+        for key in cache_keys:
+            set_cached(key, translated)
+
+@functools.lru_cache(maxsize=256)
+def detect_language(text):
+    # Script check over the whole chunk: reports 'ko' only when nearly all
+    # letters are Hangul, otherwise None and the LLM detects the language.
+    letters = sum(1 for ch in text if ch.isalpha())
+    if not letters:
+        return None
+    hangul = len(HANGUL_PATTERN.findall(text))
+    return 'ko' if hangul >= letters * KOREAN_LETTER_RATIO else None
+
+def is_same_language(src_lang, target_lang, text=None):
+    # An 'auto' target always resolves to a different language (En <-> Ko)
+    if not src_lang or not target_lang or target_lang == 'auto':
+        return False
+    if src_lang == 'auto':
+        return text is not None and detect_language(text) == target_lang.lower()
+    return src_lang.lower() == target_lang.lower()
+
+def translate_chunk_pre_built(system_prompt, user_prompt, provider, api_url, api_key, model):
+    # For callers that already rendered the prompts (e.g. a repeated language
+    # pair): skips the template lookup, formatting and cache.
+    return send_llm_request(provider, api_url, api_key, model, system_prompt, user_prompt, temperature=0.3)
+
+def translate_chunk(text, provider, api_url, api_key, model, target_lang='ko', src_lang='en', system_prompt_override=None):
+    if is_same_language(src_lang, target_lang, text):
+        # Nothing to translate; skip the template lookup and the LLM round trip
+        return text
+
+    cache_keys = translation_cache_keys(text, provider, model, target_lang, src_lang, system_prompt_override)
+    cached = lookup_translation(cache_keys)
+    if cached is not None:
+        logger.info(f"Translation cache hit ({len(text)} chars)")
+        return cached
+
+    system_prompt, user_prompt = build_prompts(text, target_lang, src_lang, system_prompt_override)
     
     try:
-        return send_llm_request(provider, api_url, api_key, model, system_prompt, user_prompt, temperature=0.3)
+        translated = translate_chunk_pre_built(system_prompt, user_prompt, provider, api_url, api_key, model)
     except Exception as e:
         logger.error(f"Translation error: {e}")
         return f"[Translation Failed] {text}"
+    cache_translation(cache_keys, translated)
+    return translated
+
+def parse_batch_response(response, expected_count):
+    # Accept a bare JSON array or one wrapped in a ```json code fence
+    body = BATCH_FENCE_PATTERN.sub('', response.strip())
+    try:
+        translations = json.loads(body)
+    except ValueError:
+        return None
+    if (
+        not isinstance(translations, list)
+        or len(translations) != expected_count
+        or not all(isinstance(item, str) for item in translations)
+    ):
+        return None
+    return translations
+
+def translate_batch(texts, provider, api_url, api_key, model, target_lang='ko', src_lang='en', system_prompt_override=None):
+    if is_same_language(src_lang, target_lang):
+        return list(texts)
+
+    # Serve cached chunks directly and only send the misses to the LLM
+    cache_keys = [
+        translation_cache_keys(text, provider, model, target_lang, src_lang, system_prompt_override)
+        for text in texts
+    ]
+    translated = [
+        text if is_same_language(src_lang, target_lang, text) else lookup_translation(keys)
+        for text, keys in zip(texts, cache_keys)
+    ]
+    missing = [i for i, value in enumerate(translated) if value is None]
+    if missing:
+        fresh = _translate_uncached_batch(
+            [texts[i] for i in missing], [cache_keys[i] for i in missing],
+            provider, api_url, api_key, model, target_lang, src_lang, system_prompt_override
+        )
+        for i, value in zip(missing, fresh):
+            translated[i] = value
+    return translated
+
+def _translate_uncached_batch(texts, cache_keys, provider, api_url, api_key, model, target_lang, src_lang, system_prompt_override):
+    if len(texts) == 1:
+        return [translate_chunk(texts[0], provider, api_url, api_key, model, target_lang, src_lang, system_prompt_override)]
+
+    system_prompt, user_prompt = build_prompts(
+        json.dumps(texts, ensure_ascii=False), target_lang, src_lang, system_prompt_override
+    )
+    try:
+        response = send_llm_request(provider, api_url, api_key, model, system_prompt + BATCH_INSTRUCTION, user_prompt, temperature=0.3)
+        translations = parse_batch_response(response, len(texts))
+        if translations is not None:
+            for keys, value in zip(cache_keys, translations):
+                cache_translation(keys, value)
+            return translations
+        logger.warning(f"Batch translation of {len(texts)} chunks returned an unexpected format; translating one by one")
+    except Exception as e:
+        logger.error(f"Batch translation error: {e}")
+    return [
+        translate_chunk(text, provider, api_url, api_key, model, target_lang, src_lang, system_prompt_override)
+        for text in texts
+    ]
+
+def pack_chunks(texts, batch_size=TRANSLATION_BATCH_SIZE, max_chars=TRANSLATION_BATCH_CHARS):
+    # Greedily group consecutive texts so each request is as full as the budget
+    # allows; a text at or over the budget always gets a batch of its own.
+    batches = []
+    current = []
+    current_chars = 0
+    for text in texts:
+        if current and (len(current) >= batch_size or current_chars + len(text) > max_chars):
+            batches.append(current)
+            current = []
+            current_chars = 0
+        current.append(text)
+        current_chars += len(text)
+    if current:
+        batches.append(current)
+    return batches
+
+def translate_chunks(texts, provider, api_url, api_key, model, target_lang='ko', src_lang='en', system_prompt_override=None, batch_size=TRANSLATION_BATCH_SIZE):
+    # Send several chunks per LLM request so the system prompt and HTTP round
+    # trip are paid once per batch instead of once per chunk.
+    translated = []
+    for batch in pack_chunks(texts, batch_size):
+        translated.extend(translate_batch(
+            batch, provider, api_url, api_key, model, target_lang, src_lang, system_prompt_override
+        ))
+    return translated
+
+async def translate_chunks_async(texts, provider, api_url, api_key, model, target_lang='ko', src_lang='en', system_prompt_override=None, batch_size=TRANSLATION_BATCH_SIZE, concurrency=TRANSLATION_CONCURRENCY):
+    # Same batching as translate_chunks, but batches run concurrently in worker
+    # threads (send_llm_request is blocking) with at most `concurrency`
+    # requests in flight, and the event loop stays free while they wait.
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(batch):
+        async with semaphore:
+            return await asyncio.to_thread(
+                translate_batch, batch, provider, api_url, api_key, model, target_lang, src_lang, system_prompt_override
+            )
+
+    batches = pack_chunks(texts, batch_size)
+    results = await asyncio.gather(*(run(batch) for batch in batches))
+    return [translated for batch_result in results for translated in batch_result]
 
 def summarize_chunk(text, provider, api_url, api_key, model, target_lang='ko'):
     # Get the global summary template
@@ -188,15 +412,14 @@ def process_translation_job(job_id: int, text_content: str, provider: str, api_u
             
             time.sleep(0.5)
             
-        final_translation = "\n\n".join(translated_parts)
-        final_summary = "\n\n".join(summary_parts)
-        
         # Consolidate input and output as requested by user with dynamic header
         src_name = LANG_NAMES_KO.get(src_lang, src_lang)
         tgt_name = LANG_NAMES_KO.get(target_lang, target_lang)
         header = f"# 텍스트입력, {src_name}, {tgt_name}"
         
-        consolidated_content = f"{header}\n{text_content}\n\n#번역결과\n{final_translation}"
+        consolidated_content = io.BytesIO()
+        consolidated_content.write(f"{header}\n{text_content}\n\n#번역결과\n".encode('utf-8'))
+        write_sections(consolidated_content, translated_parts)
 
         # Upload to MinIO
         # Generate output filename: original_filename_translation.txt
@@ -205,11 +428,11 @@ def process_translation_job(job_id: int, text_content: str, provider: str, api_u
         summary_filename = f"{name_without_ext}_summary.txt"
         
         logger.info(f"Job {job_id}: Uploading consolidated result to MinIO as {output_filename}")
-        upload_stream(consolidated_content.encode('utf-8'), output_filename, "text/plain")
+        upload_buffer(consolidated_content, output_filename, "text/plain")
 
         if summary_parts:
             logger.info(f"Job {job_id}: Uploading summary to MinIO as {summary_filename}")
-            upload_stream(final_summary.encode('utf-8'), summary_filename, "text/plain")
+            upload_buffer(write_sections(io.BytesIO(), summary_parts), summary_filename, "text/plain")
         
         job.status = "completed"
         job.progress = 100
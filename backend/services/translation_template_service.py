@@ -1,5 +1,7 @@
+import functools
 import json
 import os
+from types import MappingProxyType
 from core.logger import setup_logger
 
 logger = setup_logger("translation_template_service")
@@ -11,19 +13,29 @@ DEFAULT_TEMPLATE = {
     "user_prompt_template": "Please translate the following {source_lang} text into {target_lang}:\n\n{text}"
 }
 
+@functools.lru_cache(maxsize=1)
+def _load_template(mtime_ns, size):
+    # Keyed by the file's stat so edits from any process are picked up; the
+    # parsed template is shared between calls, so hand out a read-only view.
+    with open(TEMPLATE_FILE, 'r', encoding='utf-8') as f:
+        return MappingProxyType(json.load(f))
+
 def get_template():
-    if os.path.exists(TEMPLATE_FILE):
-        try:
-            with open(TEMPLATE_FILE, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except Exception as e:
-            logger.error(f"Failed to load template: {e}")
+    try:
+        stat = os.stat(TEMPLATE_FILE)
+    except OSError:
+        return DEFAULT_TEMPLATE
+    try:
+        return _load_template(stat.st_mtime_ns, stat.st_size)
+    except Exception as e:
+        logger.error(f"Failed to load template: {e}")
     return DEFAULT_TEMPLATE
 
 def save_template(template_data):
     try:
         with open(TEMPLATE_FILE, 'w', encoding='utf-8') as f:
             json.dump(template_data, f, ensure_ascii=False, indent=2)
+        _load_template.cache_clear()
         return True
     except Exception as e:
         logger.error(f"Failed to save template: {e}")
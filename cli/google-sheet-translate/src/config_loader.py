@@ -27,6 +27,9 @@ class Config:
         # 번역에서 제외할 문구 (쉼표로 구분)
         self.exclude_phrases_raw = os.getenv("EXCLUDE_PHRASES", "")
 
+        # 동시에 보낼 번역 요청 수 (OpenWebUI 서버의 동시 처리 한도에 맞춰 조정)
+        self.concurrency_raw = os.getenv("TRANSLATE_CONCURRENCY", "4")
+
     @property
     def exclude_phrases(self):
         """
@@ -36,6 +39,16 @@ class Config:
             return []
         return [p.strip() for p in self.exclude_phrases_raw.split(',')]
 
+    @property
+    def concurrency(self):
+        """
+        동시 번역 요청 수를 정수로 반환합니다. (잘못된 값이면 1)
+        """
+        try:
+            return max(1, int(self.concurrency_raw))
+        except ValueError:
+            return 1
+
     @property
     def columns(self):
         """
@@ -1,14 +1,58 @@
+import json
+
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    # orjson이 설치되어 있으면 요청/응답 JSON 처리에 사용합니다. (표준 json보다 빠름)
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps(data):
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False).encode('utf-8')
+
+
+def _loads(raw):
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 
 class TranslatorClient:
     """
     OpenWebUI API를 사용하여 텍스트 번역을 수행하는 클래스입니다.
     (OpenAI API와 호환되는 인터페이스를 사용합니다.)
     """
-    def __init__(self, url, api_key, model):
+    def __init__(self, url, api_key, model, pool_size=8):
         self.url = url
         self.api_key = api_key
         self.model = model
+        # 요청마다 URL 문자열을 다시 만들지 않도록 설정된 엔드포인트를 한 번만 구성합니다.
+        self.endpoint = f"{self.url}/chat/completions"
+
+        # 요청마다 TCP/TLS 연결을 새로 맺지 않도록 keep-alive 세션을 재사용합니다.
+        self.session = requests.Session()
+        self.session.headers.update({
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        })
+        adapter = HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            max_retries=Retry(
+                total=2,
+                backoff_factor=0.3,
+                status_forcelist=[502, 503, 504],
+                allowed_methods=frozenset(["POST"]),
+            ),
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
 
     def translate(self, text):
         """
@@ -18,11 +62,6 @@ class TranslatorClient:
         if not text or not text.strip():
             return ""
         
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json"
-        }
-        
         # 번역 스타일 및 역할을 정의하는 시스템 프롬프트
         system_prompt = (
             "You are a professional technical translator. "
@@ -42,9 +81,9 @@ class TranslatorClient:
         
         try:
             # API 요청 및 결과 반환
-            response = requests.post(f"{self.url}/chat/completions", headers=headers, json=payload)
+            response = self.session.post(self.endpoint, data=_dumps(payload), timeout=180)
             response.raise_for_status()
-            return response.json()['choices'][0]['message']['content'].strip()
+            return _loads(response.content)['choices'][0]['message']['content'].strip()
         except Exception as e:
             print(f"  [Error] 번역 중 오류 발생: {e}")
             return None
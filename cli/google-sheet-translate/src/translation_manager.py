@@ -1,4 +1,5 @@
 import json
+from concurrent.futures import ThreadPoolExecutor
 from .google_sheets import GoogleSheetsClient
 from .openwebui_translator import TranslatorClient
 
@@ -12,7 +13,8 @@ class TranslationManager:
         self.translator = TranslatorClient(
             config.openwebui_url, 
             config.openwebui_api_key, 
-            config.openwebui_model
+            config.openwebui_model,
+            pool_size=config.concurrency
         )
 
     def process_all_columns(self):
@@ -57,6 +59,7 @@ class TranslationManager:
             return
 
         updated_rows = []
+        pending = []  # (행 인덱스, 원문)
         for row in values:
             original = row[0] if row else ""
             if not original.strip():
@@ -69,15 +72,21 @@ class TranslationManager:
                 updated_rows.append([original])
                 continue
 
-            # 3. 번역 수행
-            print(f"  번역 중: {original[:50]}...")
-            translated = self.translator.translate(original)
-            
-            # 4. 결과 포맷팅 (원문 + 번역문)
-            if translated:
-                updated_rows.append([f"{original}\n{translated}"])
-            else:
-                updated_rows.append([original])
+            # 원문을 먼저 채워두고 번역 결과로 교체합니다. (번역 실패 시 원문 유지)
+            pending.append((len(updated_rows), original))
+            updated_rows.append([original])
+
+        # 3. 번역 수행 (네트워크 대기 시간이 겹치도록 여러 행을 동시에 요청)
+        with ThreadPoolExecutor(max_workers=self.config.concurrency) as executor:
+            futures = [
+                (index, original, executor.submit(self._translate_row, original))
+                for index, original in pending
+            ]
+            for index, original, future in futures:
+                translated = future.result()
+                # 4. 결과 포맷팅 (원문 + 번역문)
+                if translated:
+                    updated_rows[index] = [f"{original}\n{translated}"]
 
         try:
             # 5. 시트에 결과 쓰기
@@ -86,6 +95,13 @@ class TranslationManager:
         except Exception as e:
             print(f"  [Error] 시트 업데이트 실패: {e}")
 
+    def _translate_row(self, original):
+        """
+        한 셀의 원문을 번역합니다. (작업 스레드에서 실행)
+        """
+        print(f"  번역 중: {original[:50]}...")
+        return self.translator.translate(original)
+
     def _handle_sheet_error(self, e):
         """
         시트 접근 시 발생하는 일반적인 오류(권한 등)를 처리합니다.
@@ -6,6 +6,7 @@ Usage:
     python jira_cli.py update ISSUE_KEY [--description "..."] [--summary "..."] [--assignee "..."] [--labels "a,b"] [--priority "..."] [--components "a,b"] [--comment "..."] [--attachment /path/to/file] [--epic KEY]
     python jira_cli.py get ISSUE_KEY [--expand "changelog,renderedFields"] [--epic]
     python jira_cli.py types [--project PROJECT_KEY]
+    python jira_cli.py serve
 
 Environment Variables:
     ATLASSIAN_URL: Atlassian 인스턴스 URL
@@ -13,13 +14,15 @@ Environment Variables:
     ATLASSIAN_API_TOKEN: API 토큰
 """
 
+import io
 import os
 import sys
 import json
 import logging
 import argparse
+import contextlib
 from dataclasses import dataclass
-from typing import Optional, List, Dict, Any, Sequence
+from typing import Optional, List, Dict, Any, Sequence, TextIO
 
 from dotenv import load_dotenv
 from atlassian import Jira
@@ -897,6 +900,37 @@ def get_issue(
     )
 
 
+def search_issues(
+    jira: Jira,
+    jql: str,
+    fields: str,
+    limit: Optional[int],
+) -> List[Dict[str, Any]]:
+    """JQL로 여러 이슈를 한 번에 조회합니다.
+
+    Args:
+        jira (Jira): Jira 클라이언트.
+        jql (str): JQL 쿼리 (예: key in (PROJ-1, PROJ-2)).
+        fields (str): 조회할 필드 목록 (콤마 구분).
+        limit (Optional[int]): 최대 조회 개수.
+
+    Returns:
+        List[Dict[str, Any]]: 이슈 목록.
+
+    Raises:
+        IssueFetchError: 조회 실패 또는 응답 형식 이상 시.
+    """
+    try:
+        response = jira.jql(jql, fields=fields, limit=limit)
+    except Exception as e:
+        raise IssueFetchError(f"이슈 검색 실패: {e}") from e
+
+    if not isinstance(response, dict) or not isinstance(response.get("issues"), list):
+        raise IssueFetchError("이슈 검색 응답이 비정상입니다.")
+
+    return response["issues"]
+
+
 # ============================================================
 # CLI 인터페이스
 # ============================================================
@@ -983,15 +1017,93 @@ def build_parser() -> argparse.ArgumentParser:
         help="에픽 필드만 요약 출력",
     )
 
+    search_parser = subparsers.add_parser("search", help="JQL로 여러 이슈 조회")
+    search_parser.add_argument("jql", help="JQL 쿼리 (예: \"key in (PROJ-1, PROJ-2)\")")
+    search_parser.add_argument(
+        "--fields",
+        default="summary",
+        help="조회할 필드 (콤마 구분, 기본값: summary)",
+    )
+    search_parser.add_argument(
+        "--limit",
+        type=int,
+        help="최대 조회 개수",
+    )
+
     types_parser = subparsers.add_parser("types", help="이슈 타입 목록 조회")
     types_parser.add_argument(
         "--project",
         help="프로젝트 키로 필터링 (예: PROJ)",
     )
 
+    subparsers.add_parser(
+        "serve",
+        help="표준 입력의 줄 단위 JSON 요청을 반복 처리 (워커 모드)",
+    )
+
     return parser
 
 
+def run_request(argv: List[str]) -> Dict[str, Any]:
+    """CLI 명령 하나를 실행하고 출력/로그를 캡처합니다.
+
+    Args:
+        argv (List[str]): 명령 인자 리스트 (예: ["get", "PROJ-1"]).
+
+    Returns:
+        Dict[str, Any]: 종료 코드(rc), 표준 출력(stdout), 로그(log).
+    """
+    out = io.StringIO()
+    log = io.StringIO()
+    handler = logging.StreamHandler(log)
+    handler.setFormatter(
+        logging.Formatter("%(asctime)s - %(levelname)s - %(message)s", "%Y-%m-%d %H:%M:%S")
+    )
+    root = logging.getLogger()
+    previous_handlers = root.handlers[:]
+    root.handlers = [handler]
+    try:
+        with contextlib.redirect_stdout(out), contextlib.redirect_stderr(log):
+            rc = main(argv)
+    except SystemExit as e:
+        # argparse 오류는 SystemExit으로 전달됨
+        rc = e.code if isinstance(e.code, int) else 2
+    finally:
+        root.handlers = previous_handlers
+    return {"rc": rc, "stdout": out.getvalue(), "log": log.getvalue()}
+
+
+def serve(stdin: TextIO, stdout: TextIO) -> int:
+    """줄 단위 JSON 요청을 읽어 명령을 실행하고 결과를 한 줄 JSON으로 응답합니다.
+
+    요청은 ``{"argv": ["get", "PROJ-1", "--epic"]}`` 형식이며, 응답은
+    ``{"rc": 0, "stdout": "...", "log": "..."}`` 형식입니다. 프로세스를
+    재사용하므로 호출마다 인터프리터를 새로 띄우는 비용이 없습니다.
+
+    Args:
+        stdin (TextIO): 요청 입력 스트림.
+        stdout (TextIO): 응답 출력 스트림.
+
+    Returns:
+        int: 종료 코드 (입력 종료 시 0).
+    """
+    while True:
+        line = stdin.readline()
+        if not line:
+            return 0
+        if not line.strip():
+            continue
+        try:
+            argv = json.loads(line)["argv"]
+            if not isinstance(argv, list) or argv[:1] == ["serve"]:
+                raise ValueError("argv must be a command list")
+            response = run_request([str(arg) for arg in argv])
+        except (ValueError, KeyError, TypeError) as e:
+            response = {"rc": 2, "stdout": "", "log": f"잘못된 요청: {e}"}
+        stdout.write(json.dumps(response) + "\n")
+        stdout.flush()
+
+
 def main(argv: Optional[Sequence[str]] = None) -> int:
     """메인 진입점.
 
@@ -1005,6 +1117,9 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
         parser = build_parser()
         args = parser.parse_args(argv)
 
+        if args.command == "serve":
+            return serve(sys.stdin, sys.stdout)
+
         config = Config.from_env()
         jira = create_jira_client(config)
 
@@ -1121,6 +1236,19 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
 
             return 0
 
+        if args.command == "search":
+            logger.info("이슈 검색 중... (JQL: %s)", args.jql)
+
+            issues = search_issues(jira, args.jql, args.fields, args.limit)
+
+            logger.info("-" * 50)
+            logger.info("✅ 이슈 검색 성공!")
+            logger.info("Count: %s", len(issues))
+            logger.info("-" * 50)
+            print(json.dumps(issues, ensure_ascii=False, indent=2))
+
+            return 0
+
         if args.command == "types":
             logger.info("이슈 타입 조회 중... (Project: %s)", args.project or "ALL")
 
@@ -1,3 +1,5 @@
+import io
+import json
 import os
 from pathlib import Path
 
@@ -15,6 +17,7 @@ class DummyJira:
         self.attachments = []
         self.deleted = []
         self.issues = []
+        self.searches = []
 
     def issue_create(self, fields):
         self.created_fields = fields
@@ -42,6 +45,11 @@ class DummyJira:
         }
 
 
+    def jql(self, jql, fields="*all", limit=None):
+        self.searches.append((jql, fields, limit))
+        return {"issues": [{"key": "COIN-1", "fields": {"summary": "요약"}}]}
+
+
 class DummyJiraBadCreate(DummyJira):
     def issue_create(self, fields):
         return "unexpected"
@@ -323,6 +331,20 @@ def test_get_issue_bad_response(record_property):
         jira_cli.get_issue(jira, "COIN-11", expand=None)
 
 
+def test_search_issues_success(record_property):
+    record_junit_case(
+        record_property,
+        description="JQL 검색으로 여러 이슈를 한 번에 조회한다.",
+        step="search_issues에 key in JQL을 전달한다.",
+        actual="이슈 목록을 반환한다.",
+        expected="검색 요청은 한 번만 수행된다.",
+    )
+    jira = DummyJira()
+    issues = jira_cli.search_issues(jira, "key in (COIN-1)", "summary", 1)
+    assert issues[0]["key"] == "COIN-1"
+    assert jira.searches == [("key in (COIN-1)", "summary", 1)]
+
+
 def test_main_delete_requires_confirm(monkeypatch, record_property):
     record_junit_case(
         record_property,
@@ -367,3 +389,27 @@ def test_main_get(monkeypatch, capsys, record_property):
     assert exit_code == 0
     captured = capsys.readouterr()
     assert "COIN-12" in captured.out
+
+
+def test_serve_handles_json_requests(monkeypatch, record_property):
+    record_junit_case(
+        record_property,
+        description="serve 모드가 줄 단위 JSON 요청을 처리한다.",
+        step="get 요청과 잘못된 요청을 serve에 전달한다.",
+        actual="요청별 JSON 응답 한 줄.",
+        expected="get 응답에 이슈 JSON이 포함되고 잘못된 요청은 rc 2.",
+    )
+    jira = DummyJira()
+    monkeypatch.setattr(jira_cli, "create_jira_client", lambda config: jira)
+    monkeypatch.setattr(jira_cli.Config, "from_env", classmethod(lambda cls: jira_cli.Config("url", "user", "token")))
+
+    stdin = io.StringIO('{"argv": ["get", "COIN-12"]}\n\nnot-json\n')
+    stdout = io.StringIO()
+
+    assert jira_cli.serve(stdin, stdout) == 0
+
+    responses = [json.loads(line) for line in stdout.getvalue().splitlines()]
+    assert len(responses) == 2
+    assert responses[0]["rc"] == 0
+    assert json.loads(responses[0]["stdout"])["key"] == "COIN-12"
+    assert responses[1]["rc"] == 2
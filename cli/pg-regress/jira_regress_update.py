@@ -13,13 +13,27 @@ failures.
 from __future__ import annotations
 
 import argparse
+import atexit
+import functools
 import json
 import os
 import re
 import shutil
 import subprocess
-from dataclasses import dataclass
-from typing import Dict, List, Optional, Sequence, Tuple
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    BinaryIO,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
 
 
 DEFAULT_STATE_PATH = ".jira_regress_state.json"
@@ -30,8 +44,16 @@ DEFAULT_RESULTS_DIR = "results"
 DEFAULT_SQL_DIR = "sql"
 JIRA_CLI = os.path.join("..", "jira_api", "jira_cli.py")
 JIRA_DESCRIPTION_LIMIT = 32767
+AUTO_CREATE_MAX_WORKERS = 8
+AUTO_CREATE_CHECKPOINT = 16
+INTERACTIVE_CHECKPOINT = 10
+SUMMARY_PREFETCH_BATCH = 100
 ANSI_YELLOW = "\033[33m"
 ANSI_RESET = "\033[0m"
+_SUMMARY_CACHE: Dict[str, str] = {}
+NOT_OK_RE = re.compile(r"(?m)^not ok\s+\d+\s+[-+]\s+([A-Za-z0-9_]+)\s")
+# os.sendfile only accepts a regular file as the destination on Linux.
+USE_SENDFILE = hasattr(os, "sendfile") and sys.platform.startswith("linux")
 
 
 class JiraRegressError(Exception):
@@ -42,20 +64,96 @@ class MissingFileError(JiraRegressError):
     """Raised when expected input files are missing."""
 
 
-@dataclass(frozen=True)
+class EpicMeta(NamedTuple):
+    """Epic field metadata returned by jira_cli.py get --epic.
+
+    Args:
+        epic_link_field_id (Optional[str]): Epic Link custom field id.
+        epic_name_field_id (Optional[str]): Epic Name custom field id.
+        epic_link (Optional[str]): Epic Link value of the issue.
+        epic_name (Optional[str]): Epic Name value of the issue.
+    """
+
+    epic_link_field_id: Optional[str]
+    epic_name_field_id: Optional[str]
+    epic_link: Optional[str]
+    epic_name: Optional[str]
+
+
 class FailureItem:
     """Failure item metadata.
 
+    Only the byte range of the diff block (without trailing whitespace) is
+    kept; the text is read from regression.diffs on first access of ``diff``.
+
     Args:
         name (str): Test name.
-        diff (str): Diff block text.
+        diff_path (Optional[str]): Path to regression.diffs.
+        span (Optional[Tuple[int, int]]): Byte range of the diff block.
     """
 
-    name: str
-    diff: str
+    __slots__ = ("name", "_path", "_span", "_cache")
+
+    def __init__(
+        self,
+        name: str,
+        diff_path: Optional[str] = None,
+        span: Optional[Tuple[int, int]] = None,
+    ) -> None:
+        self.name = name
+        self._path = diff_path
+        self._span = span
+        self._cache: Optional[str] = None
+
+    @property
+    def diff(self) -> str:
+        """str: Diff block text, or an empty string if not found."""
+        if self._cache is None:
+            if self._path is None or self._span is None:
+                self._cache = ""
+            else:
+                start, end = self._span
+                with open(self._path, "rb") as handle:
+                    handle.seek(start)
+                    data = handle.read(end - start)
+                self._cache = data.decode("utf-8").strip()
+        return self._cache
+
+    def write_diff(self, handle: BinaryIO) -> bool:
+        """Copy the diff block bytes into an open binary file.
+
+        The bytes go straight from regression.diffs to the destination
+        without being decoded into a str.
+
+        Args:
+            handle (BinaryIO): Destination file opened in binary write mode.
+
+        Returns:
+            bool: False if the item has no diff block.
+        """
+        if self._path is None or self._span is None:
+            return False
+        start, end = self._span
+        with open(self._path, "rb") as source:
+            if not USE_SENDFILE:
+                source.seek(start)
+                handle.write(source.read(end - start))
+                return True
+            handle.flush()
+            while start < end:
+                sent = os.sendfile(
+                    handle.fileno(), source.fileno(), start, end - start
+                )
+                if sent == 0:
+                    break
+                start += sent
+        return True
 
 
-def load_failures(regression_out: str, regression_diffs: str) -> List[FailureItem]:
+def load_failures(
+    regression_out: str,
+    regression_diffs: str,
+) -> Tuple[List[str], Dict[str, FailureItem]]:
     """Load failures and their diff blocks.
 
     Args:
@@ -63,7 +161,8 @@ def load_failures(regression_out: str, regression_diffs: str) -> List[FailureIte
         regression_diffs (str): Path to regression.diffs.
 
     Returns:
-        List[FailureItem]: Ordered list of failures.
+        Tuple[List[str], Dict[str, FailureItem]]: Ordered failure names and
+            mapping of test name -> failure item.
 
     Raises:
         MissingFileError: If required input files are missing.
@@ -74,13 +173,13 @@ def load_failures(regression_out: str, regression_diffs: str) -> List[FailureIte
         raise MissingFileError(f"Missing regression diffs: {regression_diffs}")
 
     failures = _parse_not_ok(regression_out)
-    diff_map = _parse_diffs(regression_diffs)
+    diff_spans = _parse_diffs(regression_diffs)
 
-    items: List[FailureItem] = []
-    for name in failures:
-        diff_text = diff_map.get(name, "")
-        items.append(FailureItem(name=name, diff=diff_text))
-    return items
+    items = {
+        name: FailureItem(name, regression_diffs, diff_spans.get(name))
+        for name in failures
+    }
+    return failures, items
 
 
 def resolve_path(base_dir: str, value: str) -> str:
@@ -107,42 +206,35 @@ def _parse_not_ok(regression_out: str) -> List[str]:
     Returns:
         List[str]: Test names in order of appearance.
     """
-    pattern = re.compile(r"^not ok\s+\d+\s+[-+]\s+([A-Za-z0-9_]+)\s+")
-    names: List[str] = []
     with open(regression_out, "r", encoding="utf-8") as handle:
-        for line in handle:
-            match = pattern.search(line)
-            if match:
-                names.append(match.group(1))
-    return names
+        return NOT_OK_RE.findall(handle.read())
 
 
-def _parse_diffs(regression_diffs: str) -> Dict[str, str]:
-    """Parse regression.diffs into a test->diff mapping.
+def _parse_diffs(regression_diffs: str) -> Dict[str, Tuple[int, int]]:
+    """Parse regression.diffs into a test->diff block byte range mapping.
 
     Args:
         regression_diffs (str): Path to regression.diffs.
 
     Returns:
-        Dict[str, str]: Mapping from test name to full diff block text.
+        Dict[str, Tuple[int, int]]: Mapping from test name to the
+            (start, end) byte offsets of its diff block, with trailing
+            whitespace excluded.
     """
     diff_header = re.compile(
-        r"^diff -U3 .*?/(.+?)\.out .*?/results/\1\.out\s*$"
+        rb"(?m)^diff -U3 .*?/(.+?)\.out .*?/results/\1\.out\s*$"
     )
-    diff_map: Dict[str, List[str]] = {}
-    current_name: Optional[str] = None
-
-    with open(regression_diffs, "r", encoding="utf-8") as handle:
-        for line in handle:
-            header = diff_header.match(line)
-            if header:
-                current_name = header.group(1)
-                diff_map[current_name] = [line.rstrip("\n")]
-                continue
-            if current_name is not None:
-                diff_map[current_name].append(line.rstrip("\n"))
+    with open(regression_diffs, "rb") as handle:
+        data = handle.read()
 
-    return {name: "\n".join(lines).strip() for name, lines in diff_map.items()}
+    headers = list(diff_header.finditer(data))
+    diff_spans: Dict[str, Tuple[int, int]] = {}
+    for index, header in enumerate(headers):
+        start = header.start()
+        stop = headers[index + 1].start() if index + 1 < len(headers) else len(data)
+        end = start + len(data[start:stop].rstrip())
+        diff_spans[header.group(1).decode("utf-8")] = (start, end)
+    return diff_spans
 
 
 def load_state(state_path: str) -> Dict[str, str]:
@@ -167,27 +259,48 @@ def save_state(state_path: str, state: Dict[str, str]) -> None:
         state_path (str): Path to state JSON.
         state (Dict[str, str]): Mapping of test name -> issue key.
     """
-    with open(state_path, "w", encoding="utf-8") as handle:
+    # Write to a sibling temp file and rename so an interrupted save never
+    # leaves a truncated state file behind.
+    tmp_path = f"{state_path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as handle:
         json.dump(state, handle, indent=2, sort_keys=True)
+    os.replace(tmp_path, state_path)
 
 
 def next_failure(
-    failures: List[FailureItem],
+    names: List[str],
+    items_map: Dict[str, FailureItem],
     state: Dict[str, str],
 ) -> Optional[FailureItem]:
     """Return the next unprocessed failure.
 
     Args:
-        failures (List[FailureItem]): All failures.
+        names (List[str]): Ordered failure names.
+        items_map (Dict[str, FailureItem]): Mapping of test name -> item.
         state (Dict[str, str]): Processed mapping.
 
     Returns:
         Optional[FailureItem]: Next failure or None if done.
     """
-    for item in failures:
-        if item.name not in state:
-            return item
-    return None
+    return next((items_map[name] for name in names if name not in state), None)
+
+
+def description_parts(item: FailureItem) -> List[str]:
+    """Build Jira description fragments for a failure.
+
+    The diff is returned as its own fragment so callers writing to a file can
+    stream the pieces without building the joined description.
+
+    Args:
+        item (FailureItem): Failure item.
+
+    Returns:
+        List[str]: Description fragments in order.
+    """
+    header = f"pg_regress failure: {item.name}\n\n"
+    if item.diff:
+        return [header, "regression.diffs block:\n", item.diff]
+    return [header, "regression.diffs block not found."]
 
 
 def build_description(item: FailureItem) -> str:
@@ -199,10 +312,19 @@ def build_description(item: FailureItem) -> str:
     Returns:
         str: Description text.
     """
-    header = f"pg_regress failure: {item.name}"
-    if item.diff:
-        return f"{header}\n\nregression.diffs block:\n{item.diff}"
-    return f"{header}\n\nregression.diffs block not found."
+    return "".join(description_parts(item))
+
+
+def description_length(item: FailureItem) -> int:
+    """Return the Jira description length without building the text.
+
+    Args:
+        item (FailureItem): Failure item.
+
+    Returns:
+        int: Length of build_description(item).
+    """
+    return sum(map(len, description_parts(item)))
 
 
 def parse_bool(value: Optional[str]) -> bool:
@@ -237,6 +359,7 @@ def build_jira_payload(
     sql_dir: str,
     attach_description: bool,
     include_diff: bool = False,
+    existing_files: Optional[Set[str]] = None,
 ) -> Tuple[str, List[str]]:
     """Build Jira description and attachments.
 
@@ -248,6 +371,8 @@ def build_jira_payload(
         sql_dir (str): SQL directory.
         attach_description (bool): Whether to attach description as a file.
         include_diff (bool): Whether to include diff attachment.
+        existing_files (Optional[Set[str]]): Source paths known to exist
+            (see list_source_files); checked with stat() when omitted.
 
     Returns:
         Tuple[str, List[str]]: Description and attachment paths.
@@ -255,25 +380,25 @@ def build_jira_payload(
     Raises:
         MissingFileError: If required source files are missing.
     """
-    full_description = build_description(item)
     attachments = prepare_attachments(
         item.name,
         attachments_dir,
         expected_dir,
         results_dir,
         sql_dir,
+        existing_files,
     )
     if include_diff:
         attachments.append(write_diff_attachment(item, attachments_dir))
 
     if not attach_description:
-        return full_description, attachments
+        return build_description(item), attachments
 
     description_attachment = os.path.join(
         attachments_dir, f"description_{item.name}.txt"
     )
     with open(description_attachment, "w", encoding="utf-8") as handle:
-        handle.write(full_description)
+        handle.writelines(description_parts(item))
 
     short_description = (
         f"pg_regress failure: {item.name}\n\n"
@@ -303,12 +428,52 @@ def warn_description_too_long(
     print(f"{ANSI_YELLOW}{message}{ANSI_RESET}")
 
 
+def list_source_files(*directories: str) -> Set[str]:
+    """List files in source directories with one scan per directory.
+
+    Args:
+        *directories (str): Directories to scan.
+
+    Returns:
+        Set[str]: Joined paths of the files found; missing directories are
+            skipped.
+    """
+    files: Set[str] = set()
+    for directory in directories:
+        try:
+            with os.scandir(directory) as entries:
+                files.update(os.path.join(directory, entry.name) for entry in entries)
+        except OSError:
+            continue
+    return files
+
+
+def _path_exists(path: str, existing_files: Optional[Set[str]]) -> bool:
+    """Check whether a source file exists.
+
+    Args:
+        path (str): File path.
+        existing_files (Optional[Set[str]]): Known existing paths, if listed.
+
+    Returns:
+        bool: True if the file exists.
+    """
+    if existing_files is not None:
+        return path in existing_files
+    try:
+        os.stat(path)
+    except OSError:
+        return False
+    return True
+
+
 def prepare_attachments(
     test_name: str,
     workspace_dir: str,
     expected_dir: str,
     results_dir: str,
     sql_dir: str,
+    existing_files: Optional[Set[str]] = None,
 ) -> List[str]:
     """Create renamed attachments for Jira upload.
 
@@ -318,6 +483,8 @@ def prepare_attachments(
         expected_dir (str): Expected output directory.
         results_dir (str): Results output directory.
         sql_dir (str): SQL directory.
+        existing_files (Optional[Set[str]]): Source paths known to exist
+            (see list_source_files); checked with stat() when omitted.
 
     Returns:
         List[str]: Attachment file paths.
@@ -329,7 +496,11 @@ def prepare_attachments(
     result_src = os.path.join(results_dir, f"{test_name}.out")
     sql_src = os.path.join(sql_dir, f"{test_name}.sql")
 
-    missing = [path for path in [expected_src, result_src, sql_src] if not os.path.exists(path)]
+    missing = [
+        path
+        for path in (expected_src, result_src, sql_src)
+        if not _path_exists(path, existing_files)
+    ]
     if missing:
         raise MissingFileError(f"Missing files for {test_name}: {', '.join(missing)}")
 
@@ -346,6 +517,90 @@ def prepare_attachments(
     return [expected_dst, result_dst, sql_dst]
 
 
+class JiraCliPool:
+    """Pool of long-lived ``jira_cli.py serve`` worker processes.
+
+    Each worker answers one line-delimited JSON request at a time, which
+    avoids an interpreter start per Jira call. Up to ``size`` workers are
+    started lazily so concurrent auto-create calls still run in parallel.
+
+    Args:
+        size (int): Maximum number of worker processes.
+    """
+
+    def __init__(self, size: int) -> None:
+        self._slots = threading.BoundedSemaphore(size)
+        self._lock = threading.Lock()
+        self._idle: List[subprocess.Popen] = []
+        self._all: List[subprocess.Popen] = []
+
+    def run(self, args: List[str]) -> subprocess.CompletedProcess:
+        """Run a jira_cli.py command in a worker process.
+
+        Args:
+            args (List[str]): jira_cli.py arguments (e.g., ["get", "PROJ-1"]).
+
+        Returns:
+            subprocess.CompletedProcess: Return code, stdout and log output
+                (as stderr) of the command.
+
+        Raises:
+            JiraRegressError: If the worker process dies or misbehaves.
+        """
+        with self._slots:
+            worker = self._acquire()
+            try:
+                worker.stdin.write(json.dumps({"argv": args}) + "\n")
+                worker.stdin.flush()
+                line = worker.stdout.readline()
+                response = json.loads(line) if line else None
+            except (OSError, ValueError) as exc:
+                worker.kill()
+                raise JiraRegressError(f"jira_cli.py worker failed: {exc}") from exc
+            if response is None:
+                raise JiraRegressError(
+                    f"jira_cli.py worker exited (rc={worker.wait()})."
+                )
+            with self._lock:
+                self._idle.append(worker)
+        return subprocess.CompletedProcess(
+            args, response["rc"], response["stdout"], response["log"]
+        )
+
+    def close(self) -> None:
+        """Stop all worker processes."""
+        with self._lock:
+            workers, self._all, self._idle = self._all, [], []
+        for worker in workers:
+            if worker.poll() is None:
+                worker.stdin.close()
+                worker.wait()
+
+    def _acquire(self) -> subprocess.Popen:
+        """Return an idle live worker, starting a new one if needed.
+
+        Returns:
+            subprocess.Popen: Worker process.
+        """
+        with self._lock:
+            while self._idle:
+                worker = self._idle.pop()
+                if worker.poll() is None:
+                    return worker
+            worker = subprocess.Popen(
+                ["python", "-u", JIRA_CLI, "serve"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                text=True,
+            )
+            self._all.append(worker)
+            return worker
+
+
+JIRA_CLI_POOL = JiraCliPool(AUTO_CREATE_MAX_WORKERS)
+atexit.register(JIRA_CLI_POOL.close)
+
+
 def run_jira_update(
     issue_key: str,
     description: str,
@@ -366,8 +621,6 @@ def run_jira_update(
         JiraRegressError: If jira_cli.py update fails.
     """
     cmd = [
-        "python",
-        JIRA_CLI,
         "update",
         issue_key,
         "--description",
@@ -379,10 +632,10 @@ def run_jira_update(
         cmd.extend(["--attachment", attachment])
 
     if dry_run:
-        print("DRY RUN:", " ".join(cmd))
+        print(f"DRY RUN: python {JIRA_CLI} {' '.join(cmd)}")
         return
 
-    result = subprocess.run(cmd, capture_output=True, text=True)
+    result = JIRA_CLI_POOL.run(cmd)
     if result.returncode != 0:
         combined = "\n".join([result.stdout, result.stderr])
         if "Attachment failures" in combined or "첨부파일 업로드 실패" in combined:
@@ -401,6 +654,9 @@ def run_jira_update(
 def fetch_issue_summary(issue_key: str) -> str:
     """Fetch Jira issue summary via jira_cli.py get.
 
+    Summaries are cached per issue key, including those of issues created by
+    run_jira_create, so repeated lookups skip the jira_cli.py round trip.
+
     Args:
         issue_key (str): Jira issue key.
 
@@ -410,30 +666,68 @@ def fetch_issue_summary(issue_key: str) -> str:
     Raises:
         JiraRegressError: If jira_cli.py get fails or summary missing.
     """
-    cmd = ["python", JIRA_CLI, "get", issue_key]
-    result = subprocess.run(cmd, capture_output=True, text=True)
+    cached = _SUMMARY_CACHE.get(issue_key)
+    if cached is not None:
+        return cached
+
+    cmd = ["get", issue_key]
+    result = JIRA_CLI_POOL.run(cmd)
     if result.returncode != 0:
         raise JiraRegressError(
             f"jira_cli.py get failed (rc={result.returncode})\n"
             f"STDOUT:\n{result.stdout}\nSTDERR:\n{result.stderr}"
         )
 
-    raw = result.stdout.strip()
-    if not raw:
-        raise JiraRegressError("jira_cli.py get returned empty output.")
-
     try:
-        issue_data = json.loads(raw)
+        issue_data = json.loads(result.stdout)
     except json.JSONDecodeError as exc:
         raise JiraRegressError(
-            "jira_cli.py get returned non-JSON output."
+            "jira_cli.py get returned empty or non-JSON output."
         ) from exc
 
     fields = issue_data.get("fields", {})
     summary = fields.get("summary")
     if not summary:
         raise JiraRegressError("Issue summary not found in Jira response.")
-    return str(summary)
+    _SUMMARY_CACHE[issue_key] = str(summary)
+    return _SUMMARY_CACHE[issue_key]
+
+
+def prefetch_issue_summaries(issue_keys: Iterable[str]) -> None:
+    """Warm the summary cache with batched jira_cli.py search calls.
+
+    One JQL ``key in (...)`` query replaces a get round trip per key. Lookup
+    failures are ignored; fetch_issue_summary falls back to per-key gets.
+
+    Args:
+        issue_keys (Iterable[str]): Issue keys to look up.
+    """
+    keys = sorted({key for key in issue_keys if key and key not in _SUMMARY_CACHE})
+    for start in range(0, len(keys), SUMMARY_PREFETCH_BATCH):
+        batch = keys[start : start + SUMMARY_PREFETCH_BATCH]
+        cmd = [
+            "search",
+            f"key in ({', '.join(batch)})",
+            "--fields",
+            "summary",
+            "--limit",
+            str(len(batch)),
+        ]
+        try:
+            result = JIRA_CLI_POOL.run(cmd)
+        except JiraRegressError:
+            # The serve worker is unusable; leave the rest to per-key gets.
+            return
+        if result.returncode != 0:
+            continue
+        try:
+            issues = json.loads(result.stdout)
+        except json.JSONDecodeError:
+            continue
+        for issue in issues:
+            summary = issue.get("fields", {}).get("summary")
+            if issue.get("key") and summary:
+                _SUMMARY_CACHE[issue["key"]] = str(summary)
 
 
 def issue_summary_matches_test(issue_key: str, test_name: str) -> bool:
@@ -450,7 +744,11 @@ def issue_summary_matches_test(issue_key: str, test_name: str) -> bool:
         JiraRegressError: If Jira lookup fails.
     """
     summary = fetch_issue_summary(issue_key)
-    return test_name.lower() in summary.lower()
+    if test_name.lower() in summary.lower():
+        return True
+    # The user may fix the summary in Jira and re-enter the same key.
+    _SUMMARY_CACHE.pop(issue_key, None)
+    return False
 
 
 def parse_created_issue_key(raw_output: str) -> str:
@@ -502,8 +800,6 @@ def run_jira_create(
         JiraRegressError: If jira_cli.py create fails.
     """
     cmd = [
-        "python",
-        JIRA_CLI,
         "create",
         project_key,
         issue_type,
@@ -519,10 +815,10 @@ def run_jira_create(
         cmd.extend(["--attachment", attachment])
 
     if dry_run:
-        print("DRY RUN:", " ".join(cmd))
+        print(f"DRY RUN: python {JIRA_CLI} {' '.join(cmd)}")
         return None
 
-    result = subprocess.run(cmd, capture_output=True, text=True)
+    result = JIRA_CLI_POOL.run(cmd)
     combined = "\n".join([result.stdout, result.stderr])
     if result.returncode != 0:
         if "Attachment failures" in combined or "첨부파일 업로드 실패" in combined:
@@ -531,13 +827,17 @@ def run_jira_create(
                 f"but issue creation succeeded. See logs above.{ANSI_RESET}"
             )
             print(f"{ANSI_YELLOW}{combined.strip()}{ANSI_RESET}")
-            return parse_created_issue_key(combined)
-        raise JiraRegressError(
-            f"jira_cli.py create failed (rc={result.returncode})\n"
-            f"STDOUT:\n{result.stdout}\nSTDERR:\n{result.stderr}"
-        )
+            issue_key = parse_created_issue_key(combined)
+        else:
+            raise JiraRegressError(
+                f"jira_cli.py create failed (rc={result.returncode})\n"
+                f"STDOUT:\n{result.stdout}\nSTDERR:\n{result.stderr}"
+            )
+    else:
+        issue_key = parse_created_issue_key(combined.strip())
 
-    return parse_created_issue_key(combined.strip())
+    _SUMMARY_CACHE[issue_key] = summary
+    return issue_key
 
 
 def build_summary(summary_format: str, test_name: str) -> str:
@@ -560,43 +860,43 @@ def build_summary(summary_format: str, test_name: str) -> str:
     return summary_format.format(test=test_name)
 
 
-def fetch_epic_metadata(issue_key: str) -> Dict[str, Optional[str]]:
+@functools.lru_cache(maxsize=32)
+def fetch_epic_metadata(issue_key: str) -> EpicMeta:
     """Fetch Epic field metadata via jira_cli.py get --epic.
 
+    Results are cached per issue key; call ``fetch_epic_metadata.cache_clear()``
+    if the Epic changes during a run.
+
     Args:
         issue_key (str): Jira issue key.
 
     Returns:
-        Dict[str, Optional[str]]: Epic metadata summary.
+        EpicMeta: Epic metadata summary.
 
     Raises:
         JiraRegressError: If jira_cli.py get fails or output is invalid.
     """
-    cmd = ["python", JIRA_CLI, "get", issue_key, "--epic"]
-    result = subprocess.run(cmd, capture_output=True, text=True)
+    cmd = ["get", issue_key, "--epic"]
+    result = JIRA_CLI_POOL.run(cmd)
     if result.returncode != 0:
         raise JiraRegressError(
             f"jira_cli.py get --epic failed (rc={result.returncode})\n"
             f"STDOUT:\n{result.stdout}\nSTDERR:\n{result.stderr}"
         )
 
-    raw = result.stdout.strip()
-    if not raw:
-        raise JiraRegressError("jira_cli.py get --epic returned empty output.")
-
     try:
-        data = json.loads(raw)
+        data = json.loads(result.stdout)
     except json.JSONDecodeError as exc:
         raise JiraRegressError(
-            "jira_cli.py get --epic returned non-JSON output."
+            "jira_cli.py get --epic returned empty or non-JSON output."
         ) from exc
 
-    return {
-        "epic_link_field_id": data.get("epic_link_field_id"),
-        "epic_name_field_id": data.get("epic_name_field_id"),
-        "epic_link": data.get("epic_link"),
-        "epic_name": data.get("epic_name"),
-    }
+    return EpicMeta(
+        epic_link_field_id=data.get("epic_link_field_id"),
+        epic_name_field_id=data.get("epic_name_field_id"),
+        epic_link=data.get("epic_link"),
+        epic_name=data.get("epic_name"),
+    )
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -707,6 +1007,7 @@ def prepare_attachments_only(
     Returns:
         int: Exit code.
     """
+    existing_files = list_source_files(expected_dir, results_dir, sql_dir)
     for item in items:
         attachments_dir = os.path.join(attachments_root, item.name)
         if attach_description:
@@ -717,6 +1018,7 @@ def prepare_attachments_only(
                 results_dir,
                 sql_dir,
                 attach_description,
+                existing_files=existing_files,
             )
         else:
             prepare_attachments(
@@ -725,6 +1027,7 @@ def prepare_attachments_only(
                 expected_dir,
                 results_dir,
                 sql_dir,
+                existing_files,
             )
         write_diff_attachment(item, attachments_dir)
         print(f"Prepared attachments for {item.name}.")
@@ -743,20 +1046,22 @@ def write_diff_attachment(item: FailureItem, attachments_dir: str) -> str:
     """
     os.makedirs(attachments_dir, exist_ok=True)
     diff_path = os.path.join(attachments_dir, f"diff_{item.name}.diff")
-    diff_text = item.diff or "regression.diffs block not found."
-    with open(diff_path, "w", encoding="utf-8") as handle:
-        handle.write(diff_text)
+    with open(diff_path, "wb") as handle:
+        if not item.write_diff(handle):
+            handle.write(b"regression.diffs block not found.")
     return diff_path
 
 
 def resolve_auto_create_items(
-    failures: List[FailureItem],
+    names: List[str],
+    items_map: Dict[str, FailureItem],
     test_name: Optional[str],
 ) -> List[FailureItem]:
     """Resolve failure items for auto-create.
 
     Args:
-        failures (List[FailureItem]): All failures.
+        names (List[str]): Ordered failure names.
+        items_map (Dict[str, FailureItem]): Mapping of test name -> item.
         test_name (Optional[str]): Specific test name.
 
     Returns:
@@ -766,9 +1071,8 @@ def resolve_auto_create_items(
         JiraRegressError: If test name not found.
     """
     if test_name is None:
-        return failures
-    name_map = {item.name: item for item in failures}
-    item = name_map.get(test_name)
+        return [items_map[name] for name in names]
+    item = items_map.get(test_name)
     if item is None:
         raise JiraRegressError(f"Test not found in failures: {test_name}")
     return [item]
@@ -824,55 +1128,148 @@ def run_auto_create(
 
     if epic_issue_key and not dry_run:
         epic_meta = fetch_epic_metadata(epic_issue_key)
-        if not epic_meta.get("epic_link_field_id"):
+        if not epic_meta.epic_link_field_id:
             print(
                 f"{ANSI_YELLOW}Warning: Epic Link field id not found via "
                 f"jira_cli.py get --epic. Will rely on Jira defaults."
                 f"{ANSI_RESET}"
             )
 
-    for item in items:
-        attachments_dir = os.path.join(attachments_root, item.name)
-        description, attachments = build_jira_payload(
-            item,
-            attachments_dir,
-            expected_dir,
-            results_dir,
-            sql_dir,
-            True,
-            include_diff=True,
-        )
-        summary = build_summary(summary_format, item.name)
-
-        existing_key = state.get(item.name)
-        if existing_key and duplicate_handling == "update":
-            run_jira_update(
-                existing_key,
-                description,
-                attachments,
+    with ThreadPoolExecutor(max_workers=AUTO_CREATE_MAX_WORKERS) as executor:
+        futures = [
+            executor.submit(
+                _auto_create_one,
+                item,
+                state.get(item.name),
+                attachments_root,
+                expected_dir,
+                results_dir,
+                sql_dir,
+                project_key,
+                issue_type,
+                summary_format,
+                duplicate_handling,
                 dry_run,
-                epic_link=epic_issue_key,
+                epic_issue_key,
             )
-            print(f"Updated {item.name} -> {existing_key}.")
-            continue
+            for item in items
+        ]
 
-        issue_key = run_jira_create(
-            project_key,
-            issue_type,
-            summary,
+        created = 0
+        first_error: Optional[JiraRegressError] = None
+        try:
+            for item, future in zip(items, futures):
+                try:
+                    issue_key = future.result()
+                except JiraRegressError as exc:
+                    if first_error is None:
+                        first_error = exc
+                    continue
+                if issue_key:
+                    state[item.name] = issue_key
+                    created += 1
+                    if created % AUTO_CREATE_CHECKPOINT == 0:
+                        save_state(state_path, state)
+        except BaseException:
+            # Ctrl+C or an unexpected error: drop queued items instead of
+            # letting the executor create them after we stop recording keys.
+            # Items already running are waited for so their keys are kept.
+            executor.shutdown(wait=True, cancel_futures=True)
+            raise
+        finally:
+            # Record every issue that was created, including ones finished
+            # after the result loop stopped early.
+            for item, future in zip(items, futures):
+                if not future.done() or future.cancelled() or future.exception() is not None:
+                    continue
+                issue_key = future.result()
+                if issue_key and state.get(item.name) != issue_key:
+                    state[item.name] = issue_key
+                    created += 1
+            if created:
+                save_state(state_path, state)
+
+    if first_error is not None:
+        raise first_error
+    return 0
+
+
+def _auto_create_one(
+    item: FailureItem,
+    existing_key: Optional[str],
+    attachments_root: str,
+    expected_dir: str,
+    results_dir: str,
+    sql_dir: str,
+    project_key: str,
+    issue_type: str,
+    summary_format: str,
+    duplicate_handling: str,
+    dry_run: bool,
+    epic_issue_key: Optional[str],
+) -> Optional[str]:
+    """Create or update the Jira issue for a single failure.
+
+    Runs in a worker thread, so it must not touch the shared state mapping.
+
+    Args:
+        item (FailureItem): Failure item.
+        existing_key (Optional[str]): Issue key already mapped to the item.
+        attachments_root (str): Root directory for attachments.
+        expected_dir (str): Expected output directory.
+        results_dir (str): Results output directory.
+        sql_dir (str): SQL directory.
+        project_key (str): Jira project key.
+        issue_type (str): Jira issue type.
+        summary_format (str): Summary format.
+        duplicate_handling (str): update or duplicate.
+        dry_run (bool): Whether to skip execution.
+        epic_issue_key (Optional[str]): Epic issue key to link.
+
+    Returns:
+        Optional[str]: Newly created issue key, or None when an existing
+            issue was updated or on dry run.
+
+    Raises:
+        JiraRegressError: If the Jira call fails.
+    """
+    attachments_dir = os.path.join(attachments_root, item.name)
+    description, attachments = build_jira_payload(
+        item,
+        attachments_dir,
+        expected_dir,
+        results_dir,
+        sql_dir,
+        True,
+        include_diff=True,
+    )
+    summary = build_summary(summary_format, item.name)
+
+    if existing_key and duplicate_handling == "update":
+        run_jira_update(
+            existing_key,
             description,
             attachments,
             dry_run,
             epic_link=epic_issue_key,
         )
-        if issue_key:
-            state[item.name] = issue_key
-            save_state(state_path, state)
-            print(f"Created {item.name} -> {issue_key}.")
-        else:
-            print(f"DRY RUN: would create issue for {item.name}.")
+        print(f"Updated {item.name} -> {existing_key}.")
+        return None
 
-    return 0
+    issue_key = run_jira_create(
+        project_key,
+        issue_type,
+        summary,
+        description,
+        attachments,
+        dry_run,
+        epic_link=epic_issue_key,
+    )
+    if issue_key:
+        print(f"Created {item.name} -> {issue_key}.")
+    else:
+        print(f"DRY RUN: would create issue for {item.name}.")
+    return issue_key
 
 
 def main(argv: Optional[Sequence[str]] = None) -> int:
@@ -896,15 +1293,15 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
     state_path = resolve_path(base_dir, DEFAULT_STATE_PATH)
     attachments_root = resolve_path(base_dir, ".jira_regress_attachments")
 
-    failures = load_failures(regression_out, regression_diffs)
-    if not failures:
+    names, items_map = load_failures(regression_out, regression_diffs)
+    if not names:
         print("No failures found in regression.out.")
         return 0
 
     state = load_state(state_path)
     if args.auto_create:
         try:
-            items = resolve_auto_create_items(failures, args.test)
+            items = resolve_auto_create_items(names, items_map, args.test)
         except JiraRegressError as exc:
             print(str(exc))
             return 1
@@ -942,8 +1339,7 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
             return 1
 
     if args.test:
-        name_map = {item.name: item for item in failures}
-        next_item = name_map.get(args.test)
+        next_item = items_map.get(args.test)
         if next_item is None:
             print(f"Test not found in failures: {args.test}")
             return 1
@@ -957,7 +1353,7 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
                 True,
             )
     elif args.issue_key and not args.interactive:
-        next_item = next_failure(failures, state)
+        next_item = next_failure(names, items_map, state)
         if next_item is None:
             print("All failures already mapped.")
             return 0
@@ -983,7 +1379,7 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
     else:
         if args.prepare_only:
             return prepare_attachments_only(
-                failures,
+                [items_map[name] for name in names],
                 attachments_root,
                 expected_dir,
                 results_dir,
@@ -991,8 +1387,10 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
                 True,
             )
         return run_interactive(
-            failures,
+            names,
+            items_map,
             state,
+            state_path,
             attachments_root,
             expected_dir,
             results_dir,
@@ -1002,14 +1400,11 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
         )
 
     attach_description = args.description_attach
-    description_text = build_description(next_item)
-    if not attach_description and len(description_text) > JIRA_DESCRIPTION_LIMIT:
-        attach_description = True
-        warn_description_too_long(
-            args.issue_key,
-            next_item.name,
-            len(description_text),
-        )
+    if not attach_description:
+        length = description_length(next_item)
+        if length > JIRA_DESCRIPTION_LIMIT:
+            attach_description = True
+            warn_description_too_long(args.issue_key, next_item.name, length)
 
     attachments_dir = os.path.join(attachments_root, next_item.name)
     description, attachments = build_jira_payload(
@@ -1026,7 +1421,7 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
     state[next_item.name] = args.issue_key
     save_state(state_path, state)
 
-    remaining = len([item for item in failures if item.name not in state])
+    remaining = sum(1 for name in names if name not in state)
     print(
         f"Updated {next_item.name} -> {args.issue_key}. "
         f"Remaining failures: {remaining}."
@@ -1035,8 +1430,10 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
 
 
 def run_interactive(
-    failures: List[FailureItem],
+    names: List[str],
+    items_map: Dict[str, FailureItem],
     state: Dict[str, str],
+    state_path: str,
     attachments_root: str,
     expected_dir: str,
     results_dir: str,
@@ -1046,9 +1443,15 @@ def run_interactive(
 ) -> int:
     """Run interactive prompts for each failure.
 
+    State is saved every INTERACTIVE_CHECKPOINT mappings and once more when
+    the loop ends, including on Ctrl+C or an error, instead of rewriting the
+    whole file after every mapping.
+
     Args:
-        failures (List[FailureItem]): All failures.
+        names (List[str]): Ordered failure names.
+        items_map (Dict[str, FailureItem]): Mapping of test name -> item.
         state (Dict[str, str]): Processed mapping.
+        state_path (str): Path to state JSON.
         attachments_root (str): Root directory for attachments.
         expected_dir (str): Expected output directory.
         results_dir (str): Results output directory.
@@ -1059,70 +1462,81 @@ def run_interactive(
     Returns:
         int: Exit code.
     """
-    remaining = [item for item in failures if item.name not in state]
+    remaining = [items_map[name] for name in names if name not in state]
     if not remaining:
         print("All failures already mapped.")
         return 0
 
-    for item in remaining:
-        prompt = (
-            f"not ok {item.name} issue key (empty=skip, q=quit): "
-        )
-        quit_requested = False
-        while True:
-            issue_key = input(prompt).strip()
-            if not issue_key:
-                print(f"Skipped {item.name}.")
-                issue_key = ""
-                break
-            if issue_key.lower() in {"q", "quit", "exit"}:
-                print("Stopped by user.")
-                quit_requested = True
-                issue_key = ""
-                break
-            try:
-                if issue_summary_matches_test(issue_key, item.name):
-                    break
-            except JiraRegressError as exc:
-                print(f"Failed to fetch Jira issue {issue_key}: {exc}")
-            print(
-                f"Issue {issue_key} summary does not include "
-                f"test name '{item.name}'. Please re-enter."
+    # Keys already in state are often re-entered for related failures.
+    prefetch_issue_summaries(state.values())
+
+    # Exactly one item becomes mapped per update, so count down instead of
+    # rescanning every failure after each Jira update.
+    remaining_count = len(remaining)
+    unsaved = 0
+    try:
+        for item in remaining:
+            prompt = (
+                f"not ok {item.name} issue key (empty=skip, q=quit): "
             )
+            quit_requested = False
+            while True:
+                issue_key = input(prompt).strip()
+                if not issue_key:
+                    print(f"Skipped {item.name}.")
+                    issue_key = ""
+                    break
+                if issue_key.lower() in {"q", "quit", "exit"}:
+                    print("Stopped by user.")
+                    quit_requested = True
+                    issue_key = ""
+                    break
+                try:
+                    if issue_summary_matches_test(issue_key, item.name):
+                        break
+                except JiraRegressError as exc:
+                    print(f"Failed to fetch Jira issue {issue_key}: {exc}")
+                print(
+                    f"Issue {issue_key} summary does not include "
+                    f"test name '{item.name}'. Please re-enter."
+                )
 
-        if quit_requested:
-            break
-        if not issue_key:
-            continue
+            if quit_requested:
+                break
+            if not issue_key:
+                continue
 
-        effective_attach_description = attach_description
-        description_text = build_description(item)
-        if (
-            not effective_attach_description
-            and len(description_text) > JIRA_DESCRIPTION_LIMIT
-        ):
-            effective_attach_description = True
-            warn_description_too_long(
-                issue_key,
-                item.name,
-                len(description_text),
-            )
+            effective_attach_description = attach_description
+            if not effective_attach_description:
+                length = description_length(item)
+                if length > JIRA_DESCRIPTION_LIMIT:
+                    effective_attach_description = True
+                    warn_description_too_long(issue_key, item.name, length)
 
-        attachments_dir = os.path.join(attachments_root, item.name)
-        description, attachments = build_jira_payload(
-            item,
-            attachments_dir,
-            expected_dir,
-            results_dir,
-            sql_dir,
-            effective_attach_description,
-        )
-        run_jira_update(issue_key, description, attachments, dry_run)
+            attachments_dir = os.path.join(attachments_root, item.name)
+            description, attachments = build_jira_payload(
+                item,
+                attachments_dir,
+                expected_dir,
+                results_dir,
+                sql_dir,
+                effective_attach_description,
+            )
+            run_jira_update(issue_key, description, attachments, dry_run)
 
-        state[item.name] = issue_key
-        save_state(STATE_PATH, state)
-        left = len([it for it in failures if it.name not in state])
-        print(f"Updated {item.name} -> {issue_key}. Remaining failures: {left}.")
+            state[item.name] = issue_key
+            unsaved += 1
+            if unsaved >= INTERACTIVE_CHECKPOINT:
+                save_state(state_path, state)
+                unsaved = 0
+            remaining_count -= 1
+            print(
+                f"Updated {item.name} -> {issue_key}. "
+                f"Remaining failures: {remaining_count}."
+            )
+    finally:
+        if unsaved:
+            save_state(state_path, state)
 
     return 0
 
@@ -9,11 +9,23 @@ import whisper
 import os
 import sys
 import argparse
+import functools
+import hashlib
+import queue
+import re
+import shutil
+import threading
 import warnings
 
 # 경고 메시지 숨기기
 warnings.filterwarnings("ignore")
 
+# 파일명에 허용하지 않는 문자 (문자/숫자/_/공백/- 외의 모든 문자)
+UNSAFE_FILENAME_PATTERN = re.compile(r'[^\w \-]')
+
+# 같은 오디오를 다시 변환하지 않도록 변환 결과를 저장하는 캐시 디렉토리
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "youtube_sst")
+
 def get_video_title(youtube_url):
     """
     YouTube 영상의 제목을 가져옵니다.
@@ -28,7 +40,7 @@ def get_video_title(youtube_url):
             info = ydl.extract_info(youtube_url, download=False)
             title = info.get('title', 'youtube_video')
             # 파일명으로 사용할 수 없는 문자 제거
-            safe_title = "".join(c for c in title if c.isalnum() or c in (' ', '-', '_')).strip()
+            safe_title = UNSAFE_FILENAME_PATTERN.sub('', title).strip()
             safe_title = safe_title.replace(' ', '_')
             return safe_title
     except Exception as e:
@@ -68,23 +80,85 @@ def download_audio(youtube_url, output_path="temp_audio"):
         print(f"❌ 오디오 다운로드 중 오류 발생: {str(e)}")
         raise
 
-def transcribe_audio(audio_path, model_size="base", output_file="output.txt"):
+def decode_audio_stream(youtube_url):
+    """
+    오디오를 파일로 저장하지 않고 16kHz 모노 파형(float32 배열)으로 바로 디코딩합니다.
+    MP3 인코딩/재디코딩과 디스크 입출력을 생략합니다.
+    """
+    print(f"📥 오디오 스트림 디코딩 시작: {youtube_url}")
+
+    ydl_opts = {
+        'format': 'bestaudio/best',
+        'quiet': True,
+        'no_warnings': True,
+    }
+
+    try:
+        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+            info = ydl.extract_info(youtube_url, download=False)
+
+        # Whisper가 사용하는 ffmpeg 디코더로 스트림 URL을 직접 읽습니다.
+        audio = whisper.load_audio(info['url'])
+        print("✅ 오디오 디코딩 완료")
+        return audio
+
+    except Exception as e:
+        print(f"❌ 오디오 디코딩 중 오류 발생: {str(e)}")
+        raise
+
+@functools.lru_cache(maxsize=2)
+def load_model(model_size="base", device=None):
     """
-    다운로드한 오디오를 Whisper AI 모델을 사용하여 텍스트로 변환합니다.
+    Whisper AI 모델을 로드합니다. (같은 모델/장치 조합은 한 번만 로드)
+    device를 지정하지 않으면 CUDA 사용 가능 시 GPU, 아니면 CPU를 사용합니다.
     """
     print(f"\n🤖 Whisper AI 모델({model_size}) 로딩 중... (처음 실행 시 모델 다운로드로 시간이 걸릴 수 있습니다)")
-    
+    return whisper.load_model(model_size, device=device)
+
+def audio_digest(audio):
+    """
+    오디오 파일(또는 디코딩된 파형)의 내용으로 BLAKE2b 해시를 계산합니다.
+    """
+    digest = hashlib.blake2b(digest_size=20)
+    if isinstance(audio, str):
+        with open(audio, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                digest.update(block)
+    else:
+        digest.update(audio)
+    return digest.hexdigest()
+
+def transcribe_audio(audio_path, model_size="base", output_file="output.txt", model=None, device=None, use_cache=True):
+    """
+    다운로드한 오디오(파일 경로 또는 디코딩된 파형)를 Whisper AI 모델을 사용하여 텍스트로 변환합니다.
+    이미 로드한 모델을 model로 넘기면 모델을 다시 로드하지 않습니다.
+    같은 오디오/모델 조합의 변환 결과가 캐시에 있으면 음성 변환을 건너뜁니다.
+    """
     try:
-        model = whisper.load_model(model_size)
+        cache_path = None
+        if use_cache:
+            cache_path = os.path.join(CACHE_DIR, f"{audio_digest(audio_path)}_{model_size}.txt")
+            if os.path.exists(cache_path):
+                shutil.copyfile(cache_path, output_file)
+                print(f"\n✅ 캐시된 변환 결과를 사용합니다! 파일이 저장되었습니다: {output_file}")
+                return output_file
+
+        if model is None:
+            model = load_model(model_size, device)
         
         print("📝 음성 변환(STT) 진행 중... (영상 길이에 따라 시간이 소요됩니다)")
-        result = model.transcribe(audio_path)
+        # FP16은 GPU에서만 지원되므로 CPU에서는 FP32로 변환합니다.
+        result = model.transcribe(audio_path, fp16=model.device.type == "cuda")
         
         text = result["text"].strip()
         
         # 파일 저장
         with open(output_file, 'w', encoding='utf-8') as f:
             f.write(text)
+
+        if cache_path:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            shutil.copyfile(output_file, cache_path)
             
         print(f"\n✅ 변환 완료! 파일이 저장되었습니다: {output_file}")
         return output_file
@@ -93,30 +167,121 @@ def transcribe_audio(audio_path, model_size="base", output_file="output.txt"):
         print(f"❌ 음성 변환 중 오류 발생: {str(e)}")
         raise
 
+def prepare_audio(youtube_url, output_file=None, stream=False):
+    """
+    영상 제목을 확인하고 오디오를 준비합니다. (파일이 이미 존재하면 다운로드를 건너뜁니다)
+    stream이 True이면 파일 대신 메모리에 디코딩한 파형을 반환합니다.
+    
+    Returns:
+        tuple: (오디오 파일 경로 또는 파형, 출력 파일 경로)
+    """
+    # YouTube 영상 제목 가져오기
+    print("\n📺 영상 정보 확인 중...")
+    video_title = get_video_title(youtube_url)
+    print(f"✅ 영상 제목: {video_title}")
+
+    # 오디오 파일명 생성 (영상제목_mp3.mp3)
+    audio_filename = f"{video_title}_mp3"
+    final_audio_path = f"{audio_filename}.mp3"
+
+    # 출력 파일명 자동 생성
+    if not output_file:
+        output_file = f"{video_title}_stt.txt"
+
+    if stream:
+        return decode_audio_stream(youtube_url), output_file
+
+    if os.path.exists(final_audio_path):
+        print(f"\n✅ 기존 오디오 파일을 사용합니다: {final_audio_path}")
+    else:
+        final_audio_path = download_audio(youtube_url, audio_filename)
+    return final_audio_path, output_file
+
+def run_pipeline(urls, model_size="base", output_file=None, keep_audio=False, device=None, stream=False, use_cache=True):
+    """
+    오디오 다운로드(생산자 스레드)와 음성 변환(메인 스레드)을 겹쳐서 실행합니다.
+    다음 영상을 내려받는 동안 이전 영상을 변환하며, Whisper 모델은 한 번만 로드합니다.
+    
+    Returns:
+        list: 처리에 실패한 URL 목록
+    """
+    # 다운로드가 변환보다 너무 앞서 나가 디스크를 채우지 않도록 대기열 크기를 제한합니다.
+    jobs = queue.Queue(maxsize=2)
+    failed = []
+
+    def producer():
+        try:
+            for url in urls:
+                try:
+                    jobs.put((url,) + prepare_audio(url, output_file, stream))
+                except Exception as e:
+                    print(f"\n❌ 오디오 준비 실패 ({url}): {str(e)}")
+                    failed.append(url)
+        finally:
+            jobs.put(None)
+
+    threading.Thread(target=producer, daemon=True).start()
+    model = load_model(model_size, device)
+
+    while True:
+        job = jobs.get()
+        if job is None:
+            break
+        url, audio, output_path = job
+        try:
+            # AI 음성 인식
+            transcribe_audio(audio, model_size, output_path, model=model, use_cache=use_cache)
+        except Exception:
+            failed.append(url)
+            continue
+
+        # 메모리에서 디코딩한 경우 정리할 오디오 파일이 없습니다.
+        if not isinstance(audio, str):
+            continue
+        audio_path = audio
+
+        # 오디오 파일 유지 여부 처리
+        if not keep_audio and os.path.exists(audio_path):
+            os.remove(audio_path)
+            print("🧹 오디오 파일 삭제 완료")
+        elif keep_audio:
+            print(f"💾 오디오 파일 유지: {audio_path}")
+
+    return failed
+
 def main():
     parser = argparse.ArgumentParser(
         description='자막이 없는 YouTube 영상을 AI로 분석하여 텍스트로 변환합니다.'
     )
     
-    # URL을 선택적 인자로 변경 (nargs='?')
-    parser.add_argument('url', nargs='?', help='YouTube 비디오 URL')
-    parser.add_argument('-o', '--output', help='출력 파일 경로 (기본값: video_id_stt.txt)')
+    # URL을 선택적 인자로 변경 (여러 개 지정 가능)
+    parser.add_argument('urls', nargs='*', metavar='url',
+                        help='YouTube 비디오 URL (여러 개 지정 시 다운로드와 음성 변환을 겹쳐서 진행)')
+    parser.add_argument('-o', '--output', help='출력 파일 경로 (기본값: video_id_stt.txt, URL이 하나일 때만 사용)')
     parser.add_argument('-m', '--model', default='base', 
                         choices=['tiny', 'base', 'small', 'medium', 'large'],
                         help='Whisper 모델 크기 (기본값: base). 클수록 정확하지만 느립니다.')
+    parser.add_argument('--device', choices=['cuda', 'cpu'],
+                        help='Whisper 실행 장치 (기본값: CUDA 사용 가능 시 cuda, 아니면 cpu)')
+    parser.add_argument('--stream', action='store_true',
+                        help='오디오를 MP3 파일로 저장하지 않고 메모리에서 바로 디코딩하여 변환합니다.')
+    parser.add_argument('--no-cache', dest='use_cache', action='store_false',
+                        help=f'변환 결과 캐시({CACHE_DIR})를 사용하지 않고 항상 새로 변환합니다.')
     parser.add_argument('--keep-audio', action='store_true', help='임시 오디오 파일을 삭제하지 않고 유지합니다.')
     
     args = parser.parse_args()
+    if args.output and len(args.urls) > 1:
+        parser.error("--output은 URL을 하나만 지정할 때 사용할 수 있습니다.")
     
     # 인자 없이 실행된 경우 대화형 모드 실행
-    if not args.url:
+    if not args.urls:
         print("=== YouTube AI 자막 생성기 (STT) ===")
         
         # 1. URL 입력
         while True:
             url_input = input("\nYouTube URL을 입력하세요: ").strip()
             if url_input:
-                args.url = url_input
+                args.urls = [url_input]
                 break
             print("URL은 필수 입력값입니다.")
             
@@ -140,39 +305,15 @@ def main():
         
         print("\n" + "="*30 + "\n")
 
-    # YouTube 영상 제목 가져오기
-    print("\n📺 영상 정보 확인 중...")
-    video_title = get_video_title(args.url)
-    print(f"✅ 영상 제목: {video_title}")
-
-    # 오디오 파일명 생성 (영상제목_mp3.mp3)
-    audio_filename = f"{video_title}_mp3"
-    final_audio_path = f"{audio_filename}.mp3"
-
-    # 출력 파일명 자동 생성
-    if not args.output:
-        args.output = f"{video_title}_stt.txt"
-
     try:
-        # 1. 오디오 다운로드 (파일이 이미 존재하면 건너뛰기)
-        if os.path.exists(final_audio_path):
-            print(f"\n✅ 기존 오디오 파일을 사용합니다: {final_audio_path}")
-        else:
-            final_audio_path = download_audio(args.url, audio_filename)
-
-        # 2. AI 음성 인식
-        transcribe_audio(final_audio_path, args.model, args.output)
-
-        # 3. 오디오 파일 유지 여부 처리
-        if not args.keep_audio and os.path.exists(final_audio_path):
-            os.remove(final_audio_path)
-            print("🧹 오디오 파일 삭제 완료")
-        elif args.keep_audio:
-            print(f"💾 오디오 파일 유지: {final_audio_path}")
-
+        failed = run_pipeline(args.urls, args.model, args.output, args.keep_audio, args.device, args.stream, args.use_cache)
     except Exception as e:
         print(f"\n❌ 작업 실패: {str(e)}")
         sys.exit(1)
 
+    if failed:
+        print(f"\n❌ 작업 실패: {len(failed)}개 영상 처리 실패")
+        sys.exit(1)
+
 if __name__ == "__main__":
     main()
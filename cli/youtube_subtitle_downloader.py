@@ -11,6 +11,14 @@ import sys
 import argparse
 
 
+# extract_video_id에서 순서대로 시도하는 비디오 ID 패턴 (모듈 로드 시 한 번만 컴파일)
+_VIDEO_ID_PATTERNS = [
+    re.compile(r'(?:v=|\/)([0-9A-Za-z_-]{11}).*'),
+    re.compile(r'(?:embed\/)([0-9A-Za-z_-]{11})'),
+    re.compile(r'^([0-9A-Za-z_-]{11})$'),
+]
+
+
 def extract_video_id(youtube_url):
     """
     YouTube URL에서 비디오 ID를 추출합니다.
@@ -20,14 +28,8 @@ def extract_video_id(youtube_url):
     - https://youtu.be/VIDEO_ID
     - https://www.youtube.com/embed/VIDEO_ID
     """
-    patterns = [
-        r'(?:v=|\/)([0-9A-Za-z_-]{11}).*',
-        r'(?:embed\/)([0-9A-Za-z_-]{11})',
-        r'^([0-9A-Za-z_-]{11})$'
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, youtube_url)
+    for pattern in _VIDEO_ID_PATTERNS:
+        match = pattern.search(youtube_url)
         if match:
             return match.group(1)
     